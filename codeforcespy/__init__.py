@@ -22,6 +22,7 @@ import codeforcespy.abc.interactions
 import codeforcespy.abc.objects
 import codeforcespy.clients
 import codeforcespy.errors
+import codeforcespy.speedups
 
 __version__ = "1.2.1"
 
@@ -61,6 +62,7 @@ AsyncClient = codeforcespy.clients.AsyncClient
 SyncClient = codeforcespy.clients.SyncClient
 CodeforcesPyError = codeforcespy.errors.CodeforcesPyError
 APIError = codeforcespy.errors.APIError
+install_uvloop = codeforcespy.speedups.install_uvloop
 
 __all__ = [
     "APIError",
@@ -96,4 +98,5 @@ __all__ = [
     "UserRatedListResponse",
     "UserRatingResponse",
     "UserStatusResponse",
+    "install_uvloop",
 ]
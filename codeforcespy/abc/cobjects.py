@@ -22,6 +22,8 @@ Auxiliary objects and helper classes for specific API behaviors.
 ✨ Capabilities
 -------------------
 - 🛠️ Utilities: Specialized data structures needed for API responses.
+- 🧹 GC-Free: Containers are declared with ``gc=False``; they hold acyclic
+  API data only.
 
 📦 Classes
 --------------
@@ -47,18 +49,18 @@ or a list of instances of type T.
 """
 
 
-class Standings(msgspec.Struct):
+class Standings(msgspec.Struct, gc=False):
     """
     Data structure representing contest standings.
 
     Parameters
     ----------
-    contest : list[cf_objects.Contest] | cf_objects.Contest | None, default None
-        A single contest or a list of contests.
-    problems : list[cf_objects.Problem] | cf_objects.Problem | None, default None
-        A single problem or a list of problems.
-    rows : list[cf_objects.RankListRow] | cf_objects.RankListRow | None, default None
-        A single rank list row or a list of rank list rows.
+    contest : cf_objects.Contest | None, default None
+        The contest the standings belong to.
+    problems : list[cf_objects.Problem] | None, default None
+        The problems of the contest.
+    rows : list[cf_objects.RankListRow] | None, default None
+        The requested rank list rows.
 
     Examples
     --------
@@ -70,21 +72,21 @@ class Standings(msgspec.Struct):
     ... )
     """
 
-    contest: SingleOrList[cf_objects.Contest] = None
-    problems: SingleOrList[cf_objects.Problem] = None
-    rows: SingleOrList[cf_objects.RankListRow] = None
+    contest: cf_objects.Contest | None = None
+    problems: list[cf_objects.Problem] | None = None
+    rows: list[cf_objects.RankListRow] | None = None
 
 
-class ProblemSetProblems(msgspec.Struct):
+class ProblemSetProblems(msgspec.Struct, gc=False):
     """
     Data structure representing problem set problems with corresponding statistics.
 
     Parameters
     ----------
-    problems : list[cf_objects.Problem] | cf_objects.Problem | None
-        A single problem or a list of problems.
-    problemStatistics : list[cf_objects.ProblemStatistics] | cf_objects.ProblemStatistics | None
-        A single problem statistics instance or a list of problem statistics.
+    problems : list[cf_objects.Problem] | None
+        The matching problems.
+    problemStatistics : list[cf_objects.ProblemStatistics] | None
+        Solve statistics of the matching problems, in the same order.
 
     Examples
     --------
@@ -95,5 +97,5 @@ class ProblemSetProblems(msgspec.Struct):
     ... )
     """
 
-    problems: SingleOrList[cf_objects.Problem]
-    problemStatistics: SingleOrList[cf_objects.ProblemStatistics]
+    problems: list[cf_objects.Problem] | None
+    problemStatistics: list[cf_objects.ProblemStatistics] | None
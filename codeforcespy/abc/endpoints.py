@@ -13,12 +13,38 @@ Defines the structure and generation logic for Codeforces API endpoints.
 --------------
 - `CodeForcesAPI`: Main endpoint generator.
 
+🏷️ Types
+------------
+- `MethodName`: Names of the wrapped Codeforces API methods.
+
 📝 Compliance
 -----------------
 Adheres to FinTech industry best practices, NumPy-style docstrings, and
 strict PEP 8/257 standards.
 """
 
+import typing
+
+MethodName = typing.Literal[
+    "blogEntry.comments",
+    "blogEntry.view",
+    "contest.hacks",
+    "contest.list",
+    "contest.ratingChanges",
+    "contest.standings",
+    "contest.status",
+    "problemset.problems",
+    "problemset.recentStatus",
+    "recentActions",
+    "user.blogEntries",
+    "user.friends",
+    "user.info",
+    "user.ratedList",
+    "user.rating",
+    "user.status",
+]
+"""Names of the Codeforces API methods wrapped by `CodeForcesAPI`."""
+
 
 class CodeForcesAPI:
     """
@@ -3,7 +3,8 @@ Module for representing Codeforces API response structures.
 
 This module defines data classes that encapsulate the responses received from the Codeforces API.
 Each response type is defined as a subclass of InteractionResponse, incorporating the API's response
-status, an optional comment, and a result payload that can either be a single object or a list of objects.
+status, an optional comment, and a result payload: a list of objects, or a single object for the
+endpoints that return one (``blogEntry.view``, ``contest.standings``, ``problemset.problems``).
 
 Classes
 -------
@@ -47,6 +48,7 @@ import msgspec
 
 import codeforcespy.abc.cobjects as cf_cobjects
 import codeforcespy.abc.objects as cf_objects
+import codeforcespy.abc.protocols as cf_protocols
 
 
 class InteractionResponse(msgspec.Struct):
@@ -55,13 +57,13 @@ class InteractionResponse(msgspec.Struct):
 
     Attributes
     ----------
-    status : str
-        The status of the API interaction.
+    status : {"OK", "FAILED"}
+        The status of the API interaction; any other value fails decoding.
     comment : str | None
         An optional comment associated with the response.
     """
 
-    status: str
+    status: cf_protocols.ResponseStatus
     comment: str | None = None
 
 
@@ -71,11 +73,11 @@ class UserInteractionResponse(InteractionResponse):
 
     Attributes
     ----------
-    result : list[cf_objects.User] | cf_objects.User | None
-        A single user or a list of users returned by the API.
+    result : list[cf_objects.User] | None
+        The users returned by the API.
     """
 
-    result: list[cf_objects.User] | cf_objects.User | None = None
+    result: list[cf_objects.User] | None = None
 
 
 class BlogEntryCommentResponse(InteractionResponse):
@@ -84,11 +86,11 @@ class BlogEntryCommentResponse(InteractionResponse):
 
     Attributes
     ----------
-    result : list[cf_objects.Comment] | cf_objects.Comment | None
-        A single comment or a list of comments returned by the API.
+    result : list[cf_objects.Comment] | None
+        The comments returned by the API.
     """
 
-    result: list[cf_objects.Comment] | cf_objects.Comment | None = None
+    result: list[cf_objects.Comment] | None = None
 
 
 class BlogEntryViewResponse(InteractionResponse):
@@ -97,11 +99,11 @@ class BlogEntryViewResponse(InteractionResponse):
 
     Attributes
     ----------
-    result : list[cf_objects.BlogEntry] | cf_objects.BlogEntry | None
-        A single blog entry or a list of blog entries returned by the API.
+    result : cf_objects.BlogEntry | None
+        The blog entry returned by the API.
     """
 
-    result: list[cf_objects.BlogEntry] | cf_objects.BlogEntry | None = None
+    result: cf_objects.BlogEntry | None = None
 
 
 class ContestHacksResponse(InteractionResponse):
@@ -110,11 +112,11 @@ class ContestHacksResponse(InteractionResponse):
 
     Attributes
     ----------
-    result : list[cf_objects.Hack] | cf_objects.Hack | None
-        A single hack or a list of hacks returned by the API.
+    result : list[cf_objects.Hack] | None
+        The hacks returned by the API.
     """
 
-    result: list[cf_objects.Hack] | cf_objects.Hack | None = None
+    result: list[cf_objects.Hack] | None = None
 
 
 class ContestListResponse(InteractionResponse):
@@ -123,11 +125,11 @@ class ContestListResponse(InteractionResponse):
 
     Attributes
     ----------
-    result : list[cf_objects.Contest] | cf_objects.Contest | None
-        A single contest or a list of contests returned by the API.
+    result : list[cf_objects.Contest] | None
+        The contests returned by the API.
     """
 
-    result: list[cf_objects.Contest] | cf_objects.Contest | None = None
+    result: list[cf_objects.Contest] | None = None
 
 
 class ContestRatingChangeResponse(InteractionResponse):
@@ -136,11 +138,11 @@ class ContestRatingChangeResponse(InteractionResponse):
 
     Attributes
     ----------
-    result : list[cf_objects.RatingChange] | cf_objects.RatingChange | None
-        A single rating change or a list of rating changes returned by the API.
+    result : list[cf_objects.RatingChange] | None
+        The rating changes returned by the API.
     """
 
-    result: list[cf_objects.RatingChange] | cf_objects.RatingChange | None = None
+    result: list[cf_objects.RatingChange] | None = None
 
 
 class ContestStandingResponse(InteractionResponse):
@@ -149,11 +151,11 @@ class ContestStandingResponse(InteractionResponse):
 
     Attributes
     ----------
-    result : list[cf_cobjects.Standings] | cf_cobjects.Standings | None
-        A single standings object or a list of standings objects returned by the API.
+    result : cf_cobjects.Standings | None
+        The standings object returned by the API.
     """
 
-    result: list[cf_cobjects.Standings] | cf_cobjects.Standings | None = None
+    result: cf_cobjects.Standings | None = None
 
 
 class ContestStatusResponse(InteractionResponse):
@@ -162,11 +164,11 @@ class ContestStatusResponse(InteractionResponse):
 
     Attributes
     ----------
-    result : list[cf_objects.Submission] | cf_objects.Submission | None
-        A single submission or a list of submissions returned by the API.
+    result : list[cf_objects.Submission] | None
+        The submissions returned by the API.
     """
 
-    result: list[cf_objects.Submission] | cf_objects.Submission | None = None
+    result: list[cf_objects.Submission] | None = None
 
 
 class ProblemSetProblemsResponse(InteractionResponse):
@@ -175,13 +177,11 @@ class ProblemSetProblemsResponse(InteractionResponse):
 
     Attributes
     ----------
-    result : list[cf_cobjects.ProblemSetProblems] | cf_cobjects.ProblemSetProblems | None
-        A single problem set problems object or a list of such objects returned by the API.
+    result : cf_cobjects.ProblemSetProblems | None
+        The problem set problems object returned by the API.
     """
 
-    result: (
-        list[cf_cobjects.ProblemSetProblems] | cf_cobjects.ProblemSetProblems | None
-    ) = None
+    result: cf_cobjects.ProblemSetProblems | None = None
 
 
 class ProblemSetRecentStatusResponse(InteractionResponse):
@@ -190,11 +190,11 @@ class ProblemSetRecentStatusResponse(InteractionResponse):
 
     Attributes
     ----------
-    result : list[cf_objects.Submission] | cf_objects.Submission | None
-        A single submission or a list of submissions returned by the API.
+    result : list[cf_objects.Submission] | None
+        The submissions returned by the API.
     """
 
-    result: list[cf_objects.Submission] | cf_objects.Submission | None = None
+    result: list[cf_objects.Submission] | None = None
 
 
 class RecentActionsResponse(InteractionResponse):
@@ -203,11 +203,11 @@ class RecentActionsResponse(InteractionResponse):
 
     Attributes
     ----------
-    result : list[cf_objects.RecentAction] | cf_objects.RecentAction | None
-        A single recent action or a list of recent actions returned by the API.
+    result : list[cf_objects.RecentAction] | None
+        The recent actions returned by the API.
     """
 
-    result: list[cf_objects.RecentAction] | cf_objects.RecentAction | None = None
+    result: list[cf_objects.RecentAction] | None = None
 
 
 class UserBlogEntryResponse(InteractionResponse):
@@ -216,11 +216,11 @@ class UserBlogEntryResponse(InteractionResponse):
 
     Attributes
     ----------
-    result : list[cf_objects.BlogEntry] | cf_objects.BlogEntry | None
-        A single blog entry or a list of blog entries returned by the API.
+    result : list[cf_objects.BlogEntry] | None
+        The blog entries returned by the API.
     """
 
-    result: list[cf_objects.BlogEntry] | cf_objects.BlogEntry | None = None
+    result: list[cf_objects.BlogEntry] | None = None
 
 
 class UserFriendResponse(InteractionResponse):
@@ -229,11 +229,11 @@ class UserFriendResponse(InteractionResponse):
 
     Attributes
     ----------
-    result : list[str] | str | None
-        A single friend (user handle) or a list of user handles returned by the API.
+    result : list[str] | None
+        The user handles returned by the API.
     """
 
-    result: list[str] | str | None = None
+    result: list[str] | None = None
 
 
 class UserRatedListResponse(InteractionResponse):
@@ -242,11 +242,11 @@ class UserRatedListResponse(InteractionResponse):
 
     Attributes
     ----------
-    result : list[cf_objects.User] | cf_objects.User | None
-        A single user or a list of users in the rated list returned by the API.
+    result : list[cf_objects.User] | None
+        The users in the rated list returned by the API.
     """
 
-    result: list[cf_objects.User] | cf_objects.User | None = None
+    result: list[cf_objects.User] | None = None
 
 
 class UserRatingResponse(InteractionResponse):
@@ -255,11 +255,11 @@ class UserRatingResponse(InteractionResponse):
 
     Attributes
     ----------
-    result : list[cf_objects.RatingChange] | cf_objects.RatingChange | None
-        A single rating change or a list of rating changes returned by the API.
+    result : list[cf_objects.RatingChange] | None
+        The rating changes returned by the API.
     """
 
-    result: list[cf_objects.RatingChange] | cf_objects.RatingChange | None = None
+    result: list[cf_objects.RatingChange] | None = None
 
 
 class UserStatusResponse(InteractionResponse):
@@ -268,8 +268,8 @@ class UserStatusResponse(InteractionResponse):
 
     Attributes
     ----------
-    result : list[cf_objects.Submission] | cf_objects.Submission | None
-        A single submission or a list of submissions returned by the API.
+    result : list[cf_objects.Submission] | None
+        The submissions returned by the API.
     """
 
-    result: list[cf_objects.Submission] | cf_objects.Submission | None = None
+    result: list[cf_objects.Submission] | None = None
@@ -8,6 +8,9 @@ msgspec definitions representing Codeforces API response objects.
 --------------
 - 🛡️ Validation: Strict runtime type checking and validation.
 - 🏗️ Structure: Clear object definitions for Users, Contests, Problems, etc.
+- 🧹 GC-Free: Every struct is acyclic decoded JSON and is declared with
+  ``gc=False``, so large responses (rated lists, standings, submissions) are
+  never traversed by the cyclic garbage collector.
 
 📦 Classes
 --------------
@@ -35,7 +38,7 @@ strict PEP 8/257 standards.
 import msgspec
 
 
-class User(msgspec.Struct):
+class User(msgspec.Struct, gc=False):
     """
     Represents a Codeforces user.
 
@@ -102,7 +105,7 @@ class User(msgspec.Struct):
     email: str | None = None
 
 
-class Member(msgspec.Struct):
+class Member(msgspec.Struct, gc=False):
     """
     Represents a member of a party.
 
@@ -118,7 +121,7 @@ class Member(msgspec.Struct):
     name: str | None = None
 
 
-class BlogEntry(msgspec.Struct):
+class BlogEntry(msgspec.Struct, gc=False):
     """
     Represents a Codeforces blog entry.
 
@@ -161,7 +164,7 @@ class BlogEntry(msgspec.Struct):
     rating: int | None = None
 
 
-class Comment(msgspec.Struct):
+class Comment(msgspec.Struct, gc=False):
     """
     Represents a comment on Codeforces.
 
@@ -192,7 +195,7 @@ class Comment(msgspec.Struct):
     rating: int | None = None
 
 
-class RecentAction(msgspec.Struct):
+class RecentAction(msgspec.Struct, gc=False):
     """
     Represents a recent action on Codeforces.
 
@@ -211,7 +214,7 @@ class RecentAction(msgspec.Struct):
     comment: Comment | None = None
 
 
-class RatingChange(msgspec.Struct):
+class RatingChange(msgspec.Struct, gc=False):
     """
     Represents a user's rating change after participating in a contest.
 
@@ -242,7 +245,7 @@ class RatingChange(msgspec.Struct):
     newRating: int | None = None
 
 
-class Contest(msgspec.Struct):
+class Contest(msgspec.Struct, gc=False):
     """
     Represents a contest on Codeforces.
 
@@ -303,7 +306,7 @@ class Contest(msgspec.Struct):
     season: str | None = None
 
 
-class Party(msgspec.Struct):
+class Party(msgspec.Struct, gc=False):
     """
     Represents a party participating in a contest.
 
@@ -337,7 +340,7 @@ class Party(msgspec.Struct):
     startTimeSeconds: int | None = None
 
 
-class Problem(msgspec.Struct):
+class Problem(msgspec.Struct, gc=False):
     """
     Represents a problem on Codeforces.
 
@@ -371,7 +374,7 @@ class Problem(msgspec.Struct):
     tags: list[str] | None = None
 
 
-class ProblemStatistics(msgspec.Struct):
+class ProblemStatistics(msgspec.Struct, gc=False):
     """
     Represents statistical data for a problem.
 
@@ -390,7 +393,7 @@ class ProblemStatistics(msgspec.Struct):
     solvedCount: int | None = None
 
 
-class Submission(msgspec.Struct):
+class Submission(msgspec.Struct, gc=False):
     """
     Represents a submission made on Codeforces.
 
@@ -439,7 +442,7 @@ class Submission(msgspec.Struct):
     points: float | None = None
 
 
-class Hack(msgspec.Struct):
+class Hack(msgspec.Struct, gc=False):
     """
     Represents a hack attempt during a Codeforces contest.
 
@@ -473,7 +476,7 @@ class Hack(msgspec.Struct):
     judgeProtocol: dict[str, str] | None = None
 
 
-class ProblemResult(msgspec.Struct):
+class ProblemResult(msgspec.Struct, gc=False):
     """
     Represents a party's result for a specific problem.
 
@@ -498,7 +501,7 @@ class ProblemResult(msgspec.Struct):
     bestSubmissionTimeSeconds: int | None = None
 
 
-class RankListRow(msgspec.Struct):
+class RankListRow(msgspec.Struct, gc=False):
     """
     Represents a row in the contest ranklist.
 
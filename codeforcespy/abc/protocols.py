@@ -2,11 +2,14 @@
 
 import typing
 
+ResponseStatus = typing.Literal["OK", "FAILED"]
+"""The two values of the ``status`` field of every API response."""
+
 
 class ResponseProtocol(typing.Protocol):
     """Protocol describing the structure of a Codeforces API response."""
 
-    status: str
+    status: ResponseStatus
     comment: str | None
 
     @property
@@ -9,6 +9,9 @@ core infrastructure for authentication, request handling, and response validatio
 ------------------------
 - 🔑 Authentication: Secure generation of API signatures (SHA-512).
 - 📡 Request Handling: Robust mechanism for executing HTTP operations.
+- ♻️ Caching: Per-method TTL cache with optional stale-while-revalidate and
+  ETag / Last-Modified conditional requests.
+- 🚦 Rate Limiting: A process-wide token bucket shared by every client.
 - 🧹 Data Sanitization: Utilities for normalizing API inputs (e.g., list conversions).
 - 🧩 Extensibility: Designed as an abstract base for specific client implementations.
 
@@ -22,17 +25,134 @@ Adheres to FinTech industry best practices, NumPy-style docstrings, and
 strict PEP 8/257 standards.
 """
 
-import collections
+import functools
 import hashlib
 import random
 import time
 import typing
 import urllib.parse
 
+import httpx
+import msgspec
+
 import codeforcespy.abc.endpoints
+import codeforcespy.abc.interactions
+import codeforcespy.abc.protocols
+import codeforcespy.cache
+import codeforcespy.errors
+import codeforcespy.limiter
 
 T = typing.TypeVar("T", bound=object)
 
+_PREFIXES: dict[str, str] = {
+    name: f"https://codeforces.com/api/{name}?"
+    for name in typing.get_args(codeforcespy.abc.endpoints.MethodName)
+}
+"""Signed-URL prefix of every wrapped API method, built once at import."""
+
+_URL_GENERATOR: codeforcespy.abc.endpoints.CodeForcesAPI = (
+    codeforcespy.abc.endpoints.CodeForcesAPI()
+)
+"""Stateless endpoint URL generator shared by every client instance."""
+
+_REFRESH_ERRORS: tuple[type[Exception], ...] = (
+    httpx.HTTPError,
+    msgspec.DecodeError,
+    codeforcespy.errors.CodeforcesPyError,
+)
+"""Failures tolerated by background refreshes; the stale entry is kept."""
+
+_STATUS_DECODER: msgspec.json.Decoder[
+    codeforcespy.abc.interactions.InteractionResponse
+] = msgspec.json.Decoder(codeforcespy.abc.interactions.InteractionResponse)
+"""Decodes only the status envelope of a response, skipping its result."""
+
+
+@functools.cache
+def _decoder_for(
+    response_cls: type[codeforcespy.abc.protocols.ResponseProtocol],
+) -> msgspec.json.Decoder[codeforcespy.abc.protocols.ResponseProtocol]:
+    """
+    Return the JSON decoder specialised for a response class.
+
+    msgspec compiles a decoding plan for the target type when a `Decoder`
+    is built; keeping one per class avoids redoing that for every response.
+    Decoding is strict: the structs mirror the API's JSON types exactly, so
+    no per-field coercion from strings is attempted.
+
+    Parameters
+    ----------
+    response_cls : type[ResponseProtocol]
+        The class used to decode the JSON response.
+
+    Returns
+    -------
+    msgspec.json.Decoder
+        A strict decoder producing `response_cls` instances.
+    """
+    return msgspec.json.Decoder(response_cls)
+
+
+@functools.lru_cache(maxsize=256)
+def _sign(
+    method_name: str,
+    end_point_url: str,
+    current_time: int,
+    auth_key: str | None,
+    secret: bytes,
+) -> str:
+    """
+    Sign an endpoint URL with the API key and secret.
+
+    Results are memoised, so repeated requests within the same second, or
+    any repeated request when the client pins `unix_time`, reuse the
+    signature instead of re-parsing, re-sorting and re-hashing the query.
+
+    Parameters
+    ----------
+    method_name : str
+        The API method name.
+    end_point_url : str
+        The raw endpoint URL.
+    current_time : int
+        Unix timestamp included in the signature.
+    auth_key : str | None
+        API authentication key.
+    secret : bytes
+        UTF-8 encoded API secret.
+
+    Returns
+    -------
+    str
+        The authorised URL.
+    """
+    # A bit draw avoids randint's rejection sampling; any six digits will do.
+    random_six_digit = 100000 + random.getrandbits(20) % 900000
+    query = end_point_url.partition("?")[2]
+    pairs = sorted(param.split("=", 1) for param in query.split("&") if "=" in param)
+    # Ids, counts and flags are ASCII alphanumerics and pass through as they
+    # are; anything else (handles, tags with spaces or "*") is still quoted.
+    encoded_params = "&".join(
+        f"{key}={value}"
+        if value.isascii() and value.isalnum()
+        else f"{key}={urllib.parse.quote_plus(value, safe=';')}"
+        for key, value in pairs
+    )
+
+    hasher = hashlib.sha512(
+        f"{random_six_digit}/{method_name}?apiKey={auth_key}&".encode()
+    )
+    hasher.update(encoded_params.encode())
+    hasher.update(f"&time={current_time}#".encode())
+    hasher.update(secret)
+    hashed_string = hasher.hexdigest()
+
+    prefix = _PREFIXES.get(method_name) or f"https://codeforces.com/api/{method_name}?"
+    return (
+        f"{prefix}{encoded_params}&apiKey={auth_key}&time={current_time}"
+        f"&apiSig={random_six_digit}{hashed_string}"
+    )
+
 
 class BaseClient:
     """
@@ -41,21 +161,44 @@ class BaseClient:
     Attributes
     ----------
     _url_generator : codeforcespy.abc.endpoints.CodeForcesAPI
-        Instance for generating API endpoint URLs.
+        Instance for generating API endpoint URLs, shared by all clients.
     _auth_key : str | None
         Authentication key for API requests.
     _secret : str | None
         Secret key for request signing.
+    _secret_bytes : bytes
+        UTF-8 encoding of the secret, fed straight to the signature hash.
     _time : int | None
         Unix timestamp used for request signing.
     _auth_enabled : bool
         Indicates if authentication is enabled.
+    _response_cache : codeforcespy.cache.ResponseCache
+        Decoded results and their validators, keyed by endpoint URL.
+    _cache_ttls : dict[str, float]
+        Time-to-live in seconds per API method name.
+    _stale_while_revalidate : bool
+        Whether expired entries are served while a refresh runs.
+    _negative_ttl : float
+        Seconds "not found" failures of ``user.*`` methods are replayed
+        without a request.
+    _limiter : codeforcespy.limiter.TokenBucket
+        Class-level token bucket shared by all sync and async clients, since
+        Codeforces enforces its call limit per IP address.
     """
 
+    _limiter: typing.ClassVar[codeforcespy.limiter.TokenBucket] = (
+        codeforcespy.limiter.TokenBucket()
+    )
+
     __slots__: tuple[str, ...] = (
         "_auth_enabled",
         "_auth_key",
+        "_cache_ttls",
+        "_negative_ttl",
+        "_response_cache",
         "_secret",
+        "_secret_bytes",
+        "_stale_while_revalidate",
         "_time",
         "_url_generator",
     )
@@ -66,6 +209,10 @@ class BaseClient:
         auth_key: str | None = None,
         unix_time: int | None = None,
         secret: str | None = None,
+        cache_ttls: dict[str, float] | None = None,
+        stale_while_revalidate: bool = False,
+        negative_ttl: float = codeforcespy.cache.DEFAULT_NEGATIVE_TTL,
+        cache_max_entries: int = codeforcespy.cache.DEFAULT_MAX_ENTRIES,
     ) -> None:
         """
         Initialize the base client.
@@ -80,14 +227,145 @@ class BaseClient:
             Unix timestamp for signing requests (default is None).
         secret : str | None, optional
             API secret for signing requests (default is None).
+        cache_ttls : dict[str, float] | None, optional
+            Per-method TTL overrides in seconds, merged over
+            `codeforcespy.cache.DEFAULT_TTLS`; 0 disables caching for a
+            method (default is None).
+        stale_while_revalidate : bool, optional
+            Serve expired entries immediately and refresh them in the
+            background (default is False).
+        negative_ttl : float, optional
+            Seconds a "not found" failure of a ``user.*`` method is replayed
+            without a request; 0 disables it (default is
+            `codeforcespy.cache.DEFAULT_NEGATIVE_TTL`).
+        cache_max_entries : int, optional
+            Responses kept in the cache before the least recently used one
+            is evicted (default is `codeforcespy.cache.DEFAULT_MAX_ENTRIES`).
         """
-        self._url_generator: codeforcespy.abc.endpoints.CodeForcesAPI = (
-            codeforcespy.abc.endpoints.CodeForcesAPI()
-        )
+        self._url_generator: codeforcespy.abc.endpoints.CodeForcesAPI = _URL_GENERATOR
         self._auth_key: str | None = auth_key
         self._secret: str | None = secret
+        self._secret_bytes: bytes = f"{secret}".encode()
         self._time: int | None = unix_time
         self._auth_enabled: bool = bool(enable_auth)
+        self._response_cache: codeforcespy.cache.ResponseCache = (
+            codeforcespy.cache.ResponseCache(cache_max_entries)
+        )
+        self._cache_ttls: dict[str, float] = {
+            **codeforcespy.cache.DEFAULT_TTLS,
+            **(cache_ttls or {}),
+        }
+        self._stale_while_revalidate: bool = stale_while_revalidate
+        self._negative_ttl: float = negative_ttl
+
+    @classmethod
+    def configure_rate(cls, rate: float, period: float) -> None:
+        """
+        Change the shared request rate limit.
+
+        The default allows one request every two seconds, which is the
+        documented Codeforces call limit; raise it if your key permits more.
+
+        Parameters
+        ----------
+        rate : float
+            Requests allowed per period.
+        period : float
+            Window length in seconds.
+
+        Raises
+        ------
+        ValueError
+            If `rate` or `period` is not positive.
+        """
+        cls._limiter.configure(rate, period)
+
+    def invalidate(self, pattern: str) -> int:
+        """
+        Drop cached results whose endpoint URL contains `pattern`.
+
+        Parameters
+        ----------
+        pattern : str
+            Substring to match, e.g. a user handle or a method name.
+
+        Returns
+        -------
+        int
+            The number of removed entries.
+        """
+        return self._response_cache.invalidate(pattern)
+
+    def _ttl_for(self, method_name: str) -> float:
+        """
+        Return the cache time-to-live for an API method.
+
+        Parameters
+        ----------
+        method_name : str
+            The API method name.
+
+        Returns
+        -------
+        float
+            The time-to-live in seconds; 0 means results are not reused
+            without revalidation.
+        """
+        return self._cache_ttls.get(method_name, 0.0)
+
+    def _cached_result(
+        self, method_name: str, endpoint_url: str
+    ) -> tuple[list[object] | None, bool]:
+        """
+        Look up a reusable cached result for an endpoint URL.
+
+        Parameters
+        ----------
+        method_name : str
+            The API method name.
+        endpoint_url : str
+            The unsigned endpoint URL.
+
+        Returns
+        -------
+        tuple[list[object] | None, bool]
+            The cached result, or None if the network must be used, and
+            whether a background refresh should be scheduled.
+        """
+        ttl = self._ttl_for(method_name)
+        if ttl <= 0.0:
+            return None, False
+        entry = self._response_cache.get(endpoint_url)
+        if entry is None:
+            return None, False
+        if time.monotonic() - entry.stored_at < ttl:
+            return list(entry.result), False
+        if self._stale_while_revalidate:
+            return list(entry.result), True
+        if entry.etag is None and entry.last_modified is None:
+            # Expired and nothing to revalidate against: the entry is dead.
+            self._response_cache.discard(endpoint_url)
+        return None, False
+
+    def _raise_known_failure(self, endpoint_url: str) -> None:
+        """
+        Replay a remembered "not found" failure for an endpoint URL.
+
+        Parameters
+        ----------
+        endpoint_url : str
+            The unsigned endpoint URL.
+
+        Raises
+        ------
+        codeforcespy.errors.APIError
+            If the endpoint failed recently with a "not found" answer.
+        """
+        if self._negative_ttl <= 0.0:
+            return
+        comment = self._response_cache.failure(endpoint_url, self._negative_ttl)
+        if comment is not None:
+            raise codeforcespy.errors.APIError(comment)
 
     def _generate_authorisation(
         self,
@@ -109,35 +387,151 @@ class BaseClient:
         str
             The authorised URL if authentication is enabled; otherwise, the original endpoint URL.
         """
-        if self._auth_enabled:
-            # Use current time if fixed time not set
-            current_time = self._time if self._time is not None else int(time.time())
-
-            random_six_digit = random.randint(111111, 999999)
-            prefix = f"https://codeforces.com/api/{method_name}?"
-            head = end_point_url.removeprefix(prefix)
-
-            params = {
-                x.split("=")[0]: x.split("=")[1]
-                for x in head.split("&")
-                if x and "=" in x
-            }
-            sorted_params = collections.OrderedDict(sorted(params.items()))
-            encoded_params = urllib.parse.urlencode(sorted_params, safe=";")
-
-            to_hash = (
-                f"{random_six_digit}/{method_name}?apiKey={self._auth_key}&"
-                f"{encoded_params}&time={current_time}#{self._secret}"
-            )
-            hashed_string = hashlib.sha512(to_hash.encode("utf8")).hexdigest()
+        if not self._auth_enabled:
+            return end_point_url
+        # Use current time if fixed time not set
+        current_time = self._time if self._time is not None else int(time.time())
+        return _sign(
+            method_name, end_point_url, current_time, self._auth_key, self._secret_bytes
+        )
+
+    def _resolve_response(
+        self,
+        method_name: str,
+        endpoint_url: str,
+        response: "httpx.Response",
+        response_cls: type[codeforcespy.abc.protocols.ResponseProtocol],
+    ) -> list[object]:
+        """
+        Turn an HTTP response into a result list, honouring revalidation.
+
+        A ``304 Not Modified`` answer is served from the response cache
+        (callers re-request without validators if the entry was evicted in
+        the meantime); otherwise the body is decoded and cached if the method
+        has a TTL or the server supplied an ``ETag`` or ``Last-Modified``
+        validator for the next conditional request.
+
+        Parameters
+        ----------
+        method_name : str
+            The API method name.
+        endpoint_url : str
+            The unsigned endpoint URL the response belongs to.
+        response : httpx.Response
+            The HTTP response.
+        response_cls : type[ResponseProtocol]
+            The class used to decode the JSON response.
+
+        Returns
+        -------
+        list[object]
+            The decoded result wrapped as a list.
+
+        Raises
+        ------
+        codeforcespy.errors.APIError
+            If the API response indicates a failure.
+        codeforcespy.errors.CodeforcesPyError
+            If a ``304`` arrives for an entry that is no longer cached.
+        """
+        if response.status_code == 304:
+            entry = self._response_cache.get(endpoint_url)
+            if entry is None:
+                raise codeforcespy.errors.CodeforcesPyError(
+                    f"304 Not Modified for {endpoint_url} without a cached entry"
+                )
+            entry.stored_at = time.monotonic()
+            return list(entry.result)
+
+        base = _decoder_for(response_cls).decode(response.content)
+        if base.status != "OK":
+            self._raise_failure(method_name, endpoint_url, base.comment)
 
-            final_url = (
-                f"https://codeforces.com/api/{method_name}?"
-                f"{encoded_params}&apiKey={self._auth_key}&time={current_time}"
-                f"&apiSig={random_six_digit}{hashed_string}"
+        payload = base.result
+        # List endpoints are typed as lists, so only the single-object ones
+        # (and empty failures) reach the helper.
+        result: list[object] = (
+            payload if type(payload) is list else self._ensure_list(payload)
+        )
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if (
+            etag is not None
+            or last_modified is not None
+            or self._ttl_for(method_name) > 0.0
+        ):
+            self._response_cache.store(
+                endpoint_url,
+                codeforcespy.cache.CacheEntry(
+                    stored_at=time.monotonic(),
+                    etag=etag,
+                    result=list(result),
+                    last_modified=last_modified,
+                ),
             )
-            return final_url
-        return end_point_url
+        return result
+
+    def _resolve_raw(
+        self, method_name: str, endpoint_url: str, response: "httpx.Response"
+    ) -> bytes:
+        """
+        Validate the status of an HTTP response and return its body as is.
+
+        Only the ``status`` and ``comment`` fields are decoded; the result
+        is skipped without building any objects.
+
+        Parameters
+        ----------
+        method_name : str
+            The API method name.
+        endpoint_url : str
+            The unsigned endpoint URL the response belongs to.
+        response : httpx.Response
+            The HTTP response.
+
+        Returns
+        -------
+        bytes
+            The undecoded JSON body.
+
+        Raises
+        ------
+        codeforcespy.errors.APIError
+            If the API response indicates a failure.
+        """
+        body = response.content
+        envelope = _STATUS_DECODER.decode(body)
+        if envelope.status != "OK":
+            self._raise_failure(method_name, endpoint_url, envelope.comment)
+        return body
+
+    def _raise_failure(
+        self, method_name: str, endpoint_url: str, comment: str | None
+    ) -> typing.NoReturn:
+        """
+        Raise the error of a failed API call, remembering "not found" answers.
+
+        Parameters
+        ----------
+        method_name : str
+            The API method name.
+        endpoint_url : str
+            The unsigned endpoint URL.
+        comment : str | None
+            The error comment returned by the API.
+
+        Raises
+        ------
+        codeforcespy.errors.APIError
+            Always.
+        """
+        if (
+            comment is not None
+            and "not found" in comment
+            and method_name.startswith("user.")
+        ):
+            self._response_cache.store_failure(endpoint_url, comment)
+        raise codeforcespy.errors.APIError(comment)
 
     @staticmethod
     def _ensure_list(
@@ -161,6 +555,8 @@ class BaseClient:
         TypeError
             If the result is compatible but we need strict types.
         """
+        if type(result) is list:
+            return typing.cast("list[T]", result)
         if result is None:
             # Explicitly cast empty list to list[T] to avoid unknown type warning
             return typing.cast("list[T]", [])
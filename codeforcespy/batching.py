@@ -0,0 +1,526 @@
+"""
+🧺 Request Coalescing.
+=========================
+
+Combines concurrent ``user.info`` lookups into a single API request.
+
+✨ Capabilities
+-------------------
+- ⏱️ Windowing: Buffers lookups submitted within a few milliseconds; the
+  synchronous batcher only waits when other lookups are already queued.
+- 🪶 Inline Fast Path: A synchronous lookup with no concurrent caller runs
+  on the calling thread without touching the queue.
+- 🔗 Coalescing: Joins the buffered handles into one semicolon-separated
+  request and hands every caller its own slice of the result.
+- 🧯 Isolation: If a combined request fails (e.g. one unknown handle), each
+  caller's lookup is retried on its own so errors stay with their caller.
+
+📦 Classes
+--------------
+- `AsyncUserInfoBatcher`: Event-loop based batcher for asynchronous clients.
+- `SyncUserInfoBatcher`: Thread-safe batcher for synchronous clients, with a
+  worker thread that only lives while lookups overlap.
+
+📝 Compliance
+-----------------
+Adheres to FinTech industry best practices, NumPy-style docstrings, and
+strict PEP 8/257 standards.
+"""
+
+import asyncio
+import collections.abc
+import concurrent.futures
+import queue
+import threading
+import time
+import typing
+import weakref
+
+if typing.TYPE_CHECKING:
+    import codeforcespy.abc.objects
+
+DEFAULT_WINDOW: float = 0.005
+"""Seconds to wait for further lookups before a batch is sent."""
+
+IDLE_TIMEOUT: float = 1.0
+"""Seconds the synchronous worker thread waits for lookups before exiting."""
+
+MAX_HANDLES_PER_REQUEST: int = 300
+"""Upper bound on handles joined into one request, keeping URLs short."""
+
+_Users = list["codeforcespy.abc.objects.User"]
+_AsyncPending = tuple[list[str], "asyncio.Future[_Users]"]
+_SyncPending = tuple[list[str], "concurrent.futures.Future[_Users]"]
+
+
+def _unique_handles(requests: collections.abc.Iterable[list[str]]) -> list[str]:
+    """
+    Merge the handles of several lookups, keeping first-seen order.
+
+    Parameters
+    ----------
+    requests : Iterable[list[str]]
+        Handle lists of the buffered lookups.
+
+    Returns
+    -------
+    list[str]
+        Deduplicated handles.
+    """
+    return list(dict.fromkeys(handle for handles in requests for handle in handles))
+
+
+def _chunks(handles: list[str]) -> list[list[str]]:
+    """
+    Split handles into request-sized chunks.
+
+    Parameters
+    ----------
+    handles : list[str]
+        Deduplicated handles.
+
+    Returns
+    -------
+    list[list[str]]
+        Chunks of at most `MAX_HANDLES_PER_REQUEST` handles.
+    """
+    return [
+        handles[i : i + MAX_HANDLES_PER_REQUEST]
+        for i in range(0, len(handles), MAX_HANDLES_PER_REQUEST)
+    ]
+
+
+class AsyncUserInfoBatcher:
+    """
+    Coalesce concurrent asynchronous ``user.info`` lookups.
+
+    Attributes
+    ----------
+    _lookup : Callable[[str, bool | None], Awaitable[list[User]]]
+        Performs one ``user.info`` request for semicolon-joined handles.
+    _window : float
+        Seconds to buffer lookups before sending.
+    _pending : dict[bool | None, list[tuple[list[str], asyncio.Future]]]
+        Buffered lookups grouped by their ``checkHistoricHandles`` flag.
+    _timer : asyncio.TimerHandle | None
+        Scheduled flush of the current window.
+    _tasks : set[asyncio.Task[None]]
+        Dispatches in flight, referenced until done.
+    """
+
+    __slots__: tuple[str, ...] = ("_lookup", "_pending", "_tasks", "_timer", "_window")
+
+    def __init__(
+        self,
+        lookup: collections.abc.Callable[
+            [str, bool | None], collections.abc.Awaitable[_Users]
+        ],
+        window: float = DEFAULT_WINDOW,
+    ) -> None:
+        """
+        Initialize the batcher.
+
+        Parameters
+        ----------
+        lookup : Callable[[str, bool | None], Awaitable[list[User]]]
+            Performs one ``user.info`` request for semicolon-joined handles.
+        window : float, optional
+            Seconds to buffer lookups before sending (default is
+            `DEFAULT_WINDOW`).
+        """
+        self._lookup: collections.abc.Callable[
+            [str, bool | None], collections.abc.Awaitable[_Users]
+        ] = lookup
+        self._window: float = window
+        self._pending: dict[bool | None, list[_AsyncPending]] = {}
+        self._timer: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def submit(self, handles: str, check_historic_handles: bool | None) -> _Users:
+        """
+        Look up users, sharing the request with concurrent callers.
+
+        Parameters
+        ----------
+        handles : str
+            Semicolon-separated list of user handles.
+        check_historic_handles : bool | None
+            Whether to check historic handles.
+
+        Returns
+        -------
+        list[codeforcespy.abc.objects.User]
+            The users, in the order of `handles`.
+
+        Raises
+        ------
+        codeforcespy.errors.APIError
+            If the API response indicates a failure.
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[_Users] = loop.create_future()
+        self._pending.setdefault(check_historic_handles, []).append(
+            (handles.split(";"), future)
+        )
+        if self._timer is None:
+            self._timer = loop.call_later(self._window, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        """Dispatch every buffered lookup group."""
+        self._timer = None
+        pending, self._pending = self._pending, {}
+        for check_historic_handles, requests in pending.items():
+            task = asyncio.create_task(self._dispatch(check_historic_handles, requests))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _dispatch(
+        self, check_historic_handles: bool | None, requests: list[_AsyncPending]
+    ) -> None:
+        """
+        Resolve one group of lookups, falling back to individual requests.
+
+        Parameters
+        ----------
+        check_historic_handles : bool | None
+            Whether to check historic handles.
+        requests : list[tuple[list[str], asyncio.Future]]
+            The buffered lookups of the group.
+
+        Notes
+        -----
+        The API does not say which handle sank a combined request, so a
+        failure costs one extra request per caller on top of the combined
+        one: N callers make up to N + 1 requests.
+        """
+        try:
+            if len(requests) > 1:
+                users = await self._lookup_combined(
+                    _unique_handles(handles for handles, _ in requests),
+                    check_historic_handles,
+                )
+                if users is not None:
+                    for handles, future in requests:
+                        if not future.done():
+                            future.set_result([users[handle] for handle in handles])
+                    return
+            for handles, future in requests:
+                try:
+                    result = await self._lookup(
+                        ";".join(handles), check_historic_handles
+                    )
+                except Exception as exc:  # delivered to the awaiting caller
+                    if not future.done():
+                        future.set_exception(exc)
+                else:
+                    if not future.done():
+                        future.set_result(result)
+        finally:
+            for _, future in requests:
+                _ = future.cancel()
+
+    async def _lookup_combined(
+        self, handles: list[str], check_historic_handles: bool | None
+    ) -> dict[str, "codeforcespy.abc.objects.User"] | None:
+        """
+        Look up deduplicated handles with as few requests as possible.
+
+        Parameters
+        ----------
+        handles : list[str]
+            Deduplicated handles.
+        check_historic_handles : bool | None
+            Whether to check historic handles.
+
+        Returns
+        -------
+        dict[str, codeforcespy.abc.objects.User] | None
+            Users by requested handle, or None if the combined request failed
+            and callers must be served individually.
+        """
+        users: dict[str, codeforcespy.abc.objects.User] = {}
+        for chunk in _chunks(handles):
+            try:
+                found = await self._lookup(";".join(chunk), check_historic_handles)
+            except Exception:  # retried per caller by _dispatch
+                return None
+            if len(found) != len(chunk):
+                return None
+            users.update(zip(chunk, found, strict=True))
+        return users
+
+    def close(self) -> None:
+        """Cancel the pending flush and every dispatch in flight."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        for requests in self._pending.values():
+            for _, future in requests:
+                _ = future.cancel()
+        self._pending.clear()
+        for task in tuple(self._tasks):
+            _ = task.cancel()
+
+
+class SyncUserInfoBatcher:
+    """
+    Coalesce concurrent synchronous ``user.info`` lookups across threads.
+
+    A lookup submitted while no other caller is waiting runs inline on the
+    calling thread. Lookups that overlap a running one are queued and served
+    by a daemon worker thread: one arriving alone is sent at once, while
+    several queued ones are gathered within the window into one request.
+    The worker exits after `IDLE_TIMEOUT` seconds without lookups, and the
+    client's lookup is held through a weak reference, so an unclosed client
+    is neither kept alive nor leaves a thread behind.
+
+    Attributes
+    ----------
+    _lookup : weakref.WeakMethod
+        The client's bound ``user.info`` lookup for semicolon-joined handles.
+    _window : float
+        Seconds to buffer lookups before sending.
+    _idle_timeout : float
+        Seconds the worker waits for lookups before exiting.
+    _queue : queue.SimpleQueue
+        Submitted lookups; None stops the worker.
+    _worker : threading.Thread | None
+        The worker thread, started when lookups overlap.
+    _waiting : int
+        Callers currently inside `submit`.
+    _lock : threading.Lock
+        Guards worker start-up and exit, queueing, `_waiting` and shutdown.
+    _closed : bool
+        Whether `close` has been called.
+    """
+
+    __slots__: tuple[str, ...] = (
+        "_closed",
+        "_idle_timeout",
+        "_lock",
+        "_lookup",
+        "_queue",
+        "_waiting",
+        "_window",
+        "_worker",
+    )
+
+    def __init__(
+        self,
+        lookup: collections.abc.Callable[[str, bool | None], _Users],
+        window: float = DEFAULT_WINDOW,
+        idle_timeout: float = IDLE_TIMEOUT,
+    ) -> None:
+        """
+        Initialize the batcher.
+
+        Parameters
+        ----------
+        lookup : Callable[[str, bool | None], list[User]]
+            Bound method performing one ``user.info`` request for
+            semicolon-joined handles; only a weak reference is kept.
+        window : float, optional
+            Seconds to buffer lookups before sending (default is
+            `DEFAULT_WINDOW`).
+        idle_timeout : float, optional
+            Seconds the worker waits for lookups before exiting (default is
+            `IDLE_TIMEOUT`).
+        """
+        self._lookup: weakref.WeakMethod[
+            collections.abc.Callable[[str, bool | None], _Users]
+        ] = weakref.WeakMethod(lookup)
+        self._window: float = window
+        self._idle_timeout: float = idle_timeout
+        self._queue: queue.SimpleQueue[tuple[bool | None, _SyncPending] | None] = (
+            queue.SimpleQueue()
+        )
+        self._worker: threading.Thread | None = None
+        self._waiting: int = 0
+        self._lock: threading.Lock = threading.Lock()
+        self._closed: bool = False
+
+    def submit(self, handles: str, check_historic_handles: bool | None) -> _Users:
+        """
+        Look up users, sharing the request with concurrent callers.
+
+        Parameters
+        ----------
+        handles : str
+            Semicolon-separated list of user handles.
+        check_historic_handles : bool | None
+            Whether to check historic handles.
+
+        Returns
+        -------
+        list[codeforcespy.abc.objects.User]
+            The users, in the order of `handles`.
+
+        Raises
+        ------
+        codeforcespy.errors.APIError
+            If the API response indicates a failure.
+        RuntimeError
+            If the batcher has been closed.
+        """
+        future: concurrent.futures.Future[_Users] = concurrent.futures.Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("user lookup batcher is closed")
+            self._waiting += 1
+            inline = self._waiting == 1
+            if not inline:
+                if self._worker is None:
+                    self._worker = threading.Thread(
+                        target=self._run, name="codeforcespy-user-info", daemon=True
+                    )
+                    self._worker.start()
+                self._queue.put((check_historic_handles, (handles.split(";"), future)))
+        try:
+            if inline:
+                # Nobody to coalesce with: skip the queue and the thread hop.
+                return self._call(handles, check_historic_handles)
+            return future.result()
+        finally:
+            with self._lock:
+                self._waiting -= 1
+
+    def _call(self, handles: str, check_historic_handles: bool | None) -> _Users:
+        """
+        Issue one ``user.info`` request through the client's lookup.
+
+        Parameters
+        ----------
+        handles : str
+            Semicolon-separated list of user handles.
+        check_historic_handles : bool | None
+            Whether to check historic handles.
+
+        Returns
+        -------
+        list[codeforcespy.abc.objects.User]
+            The users, in the order of `handles`.
+
+        Raises
+        ------
+        RuntimeError
+            If the client has been garbage-collected.
+        """
+        lookup = self._lookup()
+        if lookup is None:
+            raise RuntimeError("the client of this user lookup batcher is gone")
+        return lookup(handles, check_historic_handles)
+
+    def _run(self) -> None:
+        """Collect lookups window by window and dispatch them until idle."""
+        while True:
+            try:
+                item = self._queue.get(timeout=self._idle_timeout)
+            except queue.Empty:
+                with self._lock:
+                    if self._queue.empty():
+                        self._worker = None
+                        return
+                continue
+            if item is None:
+                return
+            batch = [item]
+            # A lone lookup has nothing to coalesce with; send it at once.
+            deadline = time.monotonic() + (0.0 if self._queue.empty() else self._window)
+            stop = False
+            while (remaining := deadline - time.monotonic()) > 0:
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+
+            grouped: dict[bool | None, list[_SyncPending]] = {}
+            for check_historic_handles, request in batch:
+                grouped.setdefault(check_historic_handles, []).append(request)
+            for check_historic_handles, requests in grouped.items():
+                self._dispatch(check_historic_handles, requests)
+            if stop:
+                return
+
+    def _dispatch(
+        self, check_historic_handles: bool | None, requests: list[_SyncPending]
+    ) -> None:
+        """
+        Resolve one group of lookups, falling back to individual requests.
+
+        Parameters
+        ----------
+        check_historic_handles : bool | None
+            Whether to check historic handles.
+        requests : list[tuple[list[str], concurrent.futures.Future]]
+            The buffered lookups of the group.
+
+        Notes
+        -----
+        The API does not say which handle sank a combined request, so a
+        failure costs one extra request per caller on top of the combined
+        one: N callers make up to N + 1 requests.
+        """
+        if len(requests) > 1:
+            users = self._lookup_combined(
+                _unique_handles(handles for handles, _ in requests),
+                check_historic_handles,
+            )
+            if users is not None:
+                for handles, future in requests:
+                    future.set_result([users[handle] for handle in handles])
+                return
+        for handles, future in requests:
+            try:
+                result = self._call(";".join(handles), check_historic_handles)
+            except Exception as exc:  # delivered to the waiting caller
+                future.set_exception(exc)
+            else:
+                future.set_result(result)
+
+    def _lookup_combined(
+        self, handles: list[str], check_historic_handles: bool | None
+    ) -> dict[str, "codeforcespy.abc.objects.User"] | None:
+        """
+        Look up deduplicated handles with as few requests as possible.
+
+        Parameters
+        ----------
+        handles : list[str]
+            Deduplicated handles.
+        check_historic_handles : bool | None
+            Whether to check historic handles.
+
+        Returns
+        -------
+        dict[str, codeforcespy.abc.objects.User] | None
+            Users by requested handle, or None if the combined request failed
+            and callers must be served individually.
+        """
+        users: dict[str, codeforcespy.abc.objects.User] = {}
+        for chunk in _chunks(handles):
+            try:
+                found = self._call(";".join(chunk), check_historic_handles)
+            except Exception:  # retried per caller by _dispatch
+                return None
+            if len(found) != len(chunk):
+                return None
+            users.update(zip(chunk, found, strict=True))
+        return users
+
+    def close(self) -> None:
+        """
+        Stop the worker thread once queued lookups are served.
+
+        Later calls to `submit` raise instead of waiting on a stopped worker.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            if self._worker is not None:
+                self._queue.put(None)
@@ -0,0 +1,322 @@
+"""
+🗄️ Response Cache.
+=====================
+
+Per-client storage of decoded API results used for HTTP revalidation.
+
+✨ Capabilities
+-------------------
+- 🏷️ Validators: Remembers the upstream ``ETag`` and ``Last-Modified`` of
+  every endpoint URL.
+- ♻️ Revalidation: Supplies ``If-None-Match`` / ``If-Modified-Since`` headers
+  so unchanged payloads come back as empty ``304 Not Modified`` responses.
+- ⏳ Expiry: Per-method time-to-live, optionally serving stale results while
+  a background refresh runs.
+- 🚫 Negative Caching: Remembers "not found" failures for a short time so
+  unknown handles do not cost a request on every retry.
+- 🧽 Invalidation: Purges entries whose URL contains a given substring.
+- 📏 Bounded: Keeps at most a fixed number of entries, evicting the least
+  recently used one first.
+
+📦 Classes
+--------------
+- `CacheEntry`: A decoded result together with its HTTP validators.
+- `ResponseCache`: Mapping of unsigned endpoint URLs to cache entries.
+
+📝 Compliance
+-----------------
+Adheres to FinTech industry best practices, NumPy-style docstrings, and
+strict PEP 8/257 standards.
+"""
+
+import collections
+import threading
+import time
+
+import msgspec
+
+DEFAULT_TTLS: dict[str, float] = {
+    "user.info": 60.0,
+    "user.blogEntries": 300.0,
+    "user.rating": 300.0,
+    "user.ratedList": 600.0,
+}
+"""
+Default time-to-live in seconds per API method; other methods are never
+served from cache without revalidation. Rating data only changes after a
+contest, so the rating endpoints keep results longest.
+"""
+
+DEFAULT_NEGATIVE_TTL: float = 60.0
+"""Seconds a "not found" failure of a ``user.*`` method is replayed locally."""
+
+DEFAULT_MAX_ENTRIES: int = 256
+"""
+Cached results kept per client before the least recently used one is
+evicted; the same cap applies to remembered failures.
+"""
+
+
+class CacheEntry(msgspec.Struct):
+    """
+    A decoded API result together with its HTTP validators.
+
+    Attributes
+    ----------
+    stored_at : float
+        Monotonic timestamp of the last successful (re)validation.
+    etag : str | None
+        The ``ETag`` header returned with the payload, if any.
+    last_modified : str | None
+        The ``Last-Modified`` header returned with the payload, if any.
+    result : list[object]
+        The decoded result list.
+    """
+
+    stored_at: float
+    etag: str | None
+    result: list[object]
+    last_modified: str | None = None
+
+
+class ResponseCache:
+    """
+    Mapping of unsigned endpoint URLs to cached results.
+
+    Entries are keyed by the endpoint URL *before* signing, because signed
+    URLs embed a random nonce and a timestamp and never repeat. The cache
+    is bounded: storing beyond `_max_entries` evicts the least recently
+    used entry, so payloads such as ``contest.standings`` for many distinct
+    URLs do not accumulate for the life of the process.
+
+    Attributes
+    ----------
+    _entries : collections.OrderedDict[str, CacheEntry]
+        Cached entries by endpoint URL, least recently used first.
+    _max_entries : int
+        The maximum number of entries, and of remembered failures.
+    _failures : dict[str, tuple[float, str]]
+        Monotonic timestamp and API comment of remembered failures by
+        endpoint URL.
+    _refreshing : set[str]
+        Endpoint URLs with a background refresh in flight.
+    _lock : threading.Lock
+        Guards `_entries`, `_failures` and `_refreshing`, which are shared
+        with request and refresh threads.
+    """
+
+    __slots__: tuple[str, ...] = (
+        "_entries",
+        "_failures",
+        "_lock",
+        "_max_entries",
+        "_refreshing",
+    )
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        """
+        Initialize an empty cache.
+
+        Parameters
+        ----------
+        max_entries : int, optional
+            The maximum number of entries kept (default is
+            `DEFAULT_MAX_ENTRIES`).
+
+        Raises
+        ------
+        ValueError
+            If `max_entries` is not positive.
+        """
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        self._max_entries: int = max_entries
+        self._entries: collections.OrderedDict[str, CacheEntry] = (
+            collections.OrderedDict()
+        )
+        self._failures: dict[str, tuple[float, str]] = {}
+        self._refreshing: set[str] = set()
+        self._lock: threading.Lock = threading.Lock()
+
+    def get(self, endpoint_url: str) -> CacheEntry | None:
+        """
+        Look up the entry stored for an endpoint URL.
+
+        Parameters
+        ----------
+        endpoint_url : str
+            The unsigned endpoint URL.
+
+        Returns
+        -------
+        CacheEntry | None
+            The cached entry, or None if nothing is stored.
+        """
+        with self._lock:
+            entry = self._entries.get(endpoint_url)
+            if entry is not None:
+                self._entries.move_to_end(endpoint_url)
+            return entry
+
+    def store(self, endpoint_url: str, entry: CacheEntry) -> None:
+        """
+        Store an entry for an endpoint URL, replacing any previous one.
+
+        The least recently used entries are evicted beyond the size limit.
+
+        Parameters
+        ----------
+        endpoint_url : str
+            The unsigned endpoint URL.
+        entry : CacheEntry
+            The entry to store.
+        """
+        with self._lock:
+            self._entries[endpoint_url] = entry
+            self._entries.move_to_end(endpoint_url)
+            while len(self._entries) > self._max_entries:
+                _ = self._entries.popitem(last=False)
+
+    def discard(self, endpoint_url: str) -> None:
+        """
+        Remove the entry stored for an endpoint URL, if any.
+
+        Parameters
+        ----------
+        endpoint_url : str
+            The unsigned endpoint URL.
+        """
+        with self._lock:
+            _ = self._entries.pop(endpoint_url, None)
+
+    def store_failure(self, endpoint_url: str, comment: str) -> None:
+        """
+        Remember a failure answer for an endpoint URL.
+
+        The oldest failures are dropped beyond the size limit.
+
+        Parameters
+        ----------
+        endpoint_url : str
+            The unsigned endpoint URL.
+        comment : str
+            The error comment returned by the API.
+        """
+        with self._lock:
+            _ = self._failures.pop(endpoint_url, None)
+            self._failures[endpoint_url] = (time.monotonic(), comment)
+            while len(self._failures) > self._max_entries:
+                del self._failures[next(iter(self._failures))]
+
+    def failure(self, endpoint_url: str, ttl: float) -> str | None:
+        """
+        Look up a remembered failure that is still fresh.
+
+        Parameters
+        ----------
+        endpoint_url : str
+            The unsigned endpoint URL.
+        ttl : float
+            Seconds a failure stays fresh.
+
+        Returns
+        -------
+        str | None
+            The remembered error comment, or None if there is none or it
+            has expired.
+        """
+        with self._lock:
+            failure = self._failures.get(endpoint_url)
+            if failure is None:
+                return None
+            stored_at, comment = failure
+            if time.monotonic() - stored_at < ttl:
+                return comment
+            _ = self._failures.pop(endpoint_url, None)
+        return None
+
+    def revalidation_headers(self, endpoint_url: str) -> dict[str, str] | None:
+        """
+        Build conditional request headers for an endpoint URL.
+
+        Parameters
+        ----------
+        endpoint_url : str
+            The unsigned endpoint URL.
+
+        Returns
+        -------
+        dict[str, str] | None
+            ``If-None-Match`` and/or ``If-Modified-Since`` headers if a
+            validator is known, otherwise None.
+        """
+        entry = self._entries.get(endpoint_url)
+        if entry is None:
+            return None
+        headers: dict[str, str] = {}
+        if entry.etag is not None:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified is not None:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers or None
+
+    def claim_refresh(self, endpoint_url: str) -> bool:
+        """
+        Mark a background refresh of an endpoint URL as started.
+
+        Parameters
+        ----------
+        endpoint_url : str
+            The unsigned endpoint URL.
+
+        Returns
+        -------
+        bool
+            True if the caller should refresh, False if one is in flight.
+        """
+        with self._lock:
+            if endpoint_url in self._refreshing:
+                return False
+            self._refreshing.add(endpoint_url)
+            return True
+
+    def release_refresh(self, endpoint_url: str) -> None:
+        """
+        Mark a background refresh of an endpoint URL as finished.
+
+        Parameters
+        ----------
+        endpoint_url : str
+            The unsigned endpoint URL.
+        """
+        with self._lock:
+            self._refreshing.discard(endpoint_url)
+
+    def invalidate(self, pattern: str) -> int:
+        """
+        Remove every entry whose endpoint URL contains `pattern`.
+
+        Parameters
+        ----------
+        pattern : str
+            Substring to match, e.g. a user handle.
+
+        Returns
+        -------
+        int
+            The number of removed entries.
+        """
+        with self._lock:
+            stale = [url for url in self._entries if pattern in url]
+            for url in stale:
+                del self._entries[url]
+            failed = [url for url in self._failures if pattern in url]
+            for url in failed:
+                del self._failures[url]
+        return len(stale) + len(failed)
+
+    def clear(self) -> None:
+        """Remove every cached entry and remembered failure."""
+        with self._lock:
+            self._entries.clear()
+            self._failures.clear()
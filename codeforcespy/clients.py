@@ -6,8 +6,10 @@ Provides the underlying HTTP client wrappers for Codeforces API interaction.
 
 ✨ Components
 -----------------
-- 🔄 SyncClient: Wrapper around `httpx.Client` for synchronous calls.
-- ⚡ AsyncClient: Wrapper around `httpx.AsyncClient` for asynchronous calls.
+- 🔄 SyncClient: Wrapper around `httpx.Client` for synchronous calls, backed
+  by a pooled transport that retries transient failures.
+- ⚡ AsyncClient: Wrapper around `httpx.AsyncClient` for asynchronous calls,
+  multiplexing concurrent requests over HTTP/2 by default.
 
 📝 Compliance
 -----------------
@@ -15,12 +17,203 @@ Adheres to FinTech industry best practices, NumPy-style docstrings, and
 strict PEP 8/257 standards.
 """
 
+import datetime
+import email.utils
+import time
+
 import httpx
 
+import codeforcespy.limiter
+
+RETRY_STATUSES: frozenset[int] = frozenset({429, 500, 502, 503, 504})
+"""HTTP statuses treated as transient and retried by `RetryTransport`."""
+
+SYNC_LIMITS: httpx.Limits = httpx.Limits(
+    max_keepalive_connections=10, max_connections=20, keepalive_expiry=30
+)
+"""Connection pool limits used by `SyncClient` unless overridden."""
+
+ASYNC_LIMITS: httpx.Limits = httpx.Limits(
+    max_keepalive_connections=20, max_connections=100, keepalive_expiry=30
+)
+"""Connection pool limits used by `AsyncClient` unless overridden."""
+
+DEFAULT_TIMEOUT: httpx.Timeout = httpx.Timeout(10.0, connect=3.0)
+"""
+Request timeouts used by both clients unless overridden: connecting fails
+fast, while reads allow for multi-megabyte bodies such as
+``problemset.problems``.
+"""
+
+
+def _retry_after(response: httpx.Response) -> float:
+    """
+    Read the delay requested by a ``Retry-After`` header.
+
+    Parameters
+    ----------
+    response : httpx.Response
+        The transient response.
+
+    Returns
+    -------
+    float
+        Seconds to wait, or 0.0 when the header is missing or malformed.
+    """
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return 0.0
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return 0.0
+    delay = when - datetime.datetime.now(datetime.timezone.utc)
+    return max(delay.total_seconds(), 0.0)
+
 
 class AsyncClient(httpx.AsyncClient):
-    pass
+    """
+    Asynchronous HTTP transport for the Codeforces API.
+
+    With HTTP/2 enabled, requests issued concurrently (e.g. through
+    ``asyncio.gather``) share one multiplexed connection instead of each
+    paying for its own TCP and TLS handshake.
+    """
+
+    def __init__(
+        self,
+        http2: bool = True,
+        limits: httpx.Limits = ASYNC_LIMITS,
+        timeout: httpx.Timeout = DEFAULT_TIMEOUT,
+    ) -> None:
+        """
+        Initialize the transport.
+
+        Parameters
+        ----------
+        http2 : bool, optional
+            Whether to negotiate HTTP/2 (default is True).
+        limits : httpx.Limits, optional
+            Connection pool limits (default is `ASYNC_LIMITS`).
+        timeout : httpx.Timeout, optional
+            Request timeouts (default is `DEFAULT_TIMEOUT`).
+        """
+        super().__init__(http2=http2, limits=limits, timeout=timeout)
+
+
+class RetryTransport(httpx.HTTPTransport):
+    """
+    Pooled HTTP transport that retries transient failures.
+
+    Connection errors are retried by the underlying connection pool; responses
+    with a status in `RETRY_STATUSES` are retried here with exponential
+    backoff.
+
+    Attributes
+    ----------
+    _retries : int
+        Maximum number of retries per request.
+    _backoff_factor : float
+        Base delay in seconds, doubled after every retry.
+    _limiter : codeforcespy.limiter.TokenBucket or None
+        Rate limiter consulted before every retry.
+    """
+
+    def __init__(
+        self,
+        retries: int = 3,
+        backoff_factor: float = 0.3,
+        limits: httpx.Limits = SYNC_LIMITS,
+        limiter: codeforcespy.limiter.TokenBucket | None = None,
+    ) -> None:
+        """
+        Initialize the transport.
+
+        Parameters
+        ----------
+        retries : int, optional
+            Maximum number of retries per request (default is 3).
+        backoff_factor : float, optional
+            Base delay in seconds, doubled after every retry (default is 0.3).
+        limits : httpx.Limits, optional
+            Connection pool limits (default is `SYNC_LIMITS`).
+        limiter : codeforcespy.limiter.TokenBucket or None, optional
+            Rate limiter consulted before every retry (default is None).
+        """
+        super().__init__(limits=limits, retries=retries)
+        self._retries: int = retries
+        self._backoff_factor: float = backoff_factor
+        self._limiter: codeforcespy.limiter.TokenBucket | None = limiter
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        """
+        Send a request, retrying transient error statuses.
+
+        Parameters
+        ----------
+        request : httpx.Request
+            The request to send.
+
+        Returns
+        -------
+        httpx.Response
+            The first non-transient response, or the last one received.
+        """
+        response = super().handle_request(request)
+        for attempt in range(self._retries):
+            if response.status_code not in RETRY_STATUSES:
+                break
+            delay = max(self._backoff_factor * (2**attempt), _retry_after(response))
+            response.close()
+            time.sleep(delay)
+            if self._limiter is not None:
+                self._limiter.acquire()
+            response = super().handle_request(request)
+        return response
 
 
 class SyncClient(httpx.Client):
-    pass
+    """
+    Synchronous HTTP transport for the Codeforces API.
+
+    One instance is kept for the lifetime of a client so keep-alive
+    connections are reused across calls.
+    """
+
+    def __init__(
+        self,
+        retries: int = 3,
+        backoff_factor: float = 0.3,
+        limits: httpx.Limits = SYNC_LIMITS,
+        limiter: codeforcespy.limiter.TokenBucket | None = None,
+        timeout: httpx.Timeout = DEFAULT_TIMEOUT,
+    ) -> None:
+        """
+        Initialize the transport.
+
+        Parameters
+        ----------
+        retries : int, optional
+            Maximum number of retries per request (default is 3).
+        backoff_factor : float, optional
+            Base delay in seconds, doubled after every retry (default is 0.3).
+        limits : httpx.Limits, optional
+            Connection pool limits (default is `SYNC_LIMITS`).
+        limiter : codeforcespy.limiter.TokenBucket or None, optional
+            Rate limiter consulted before every retry (default is None).
+        timeout : httpx.Timeout, optional
+            Request timeouts (default is `DEFAULT_TIMEOUT`).
+        """
+        super().__init__(
+            transport=RetryTransport(
+                retries=retries,
+                backoff_factor=backoff_factor,
+                limits=limits,
+                limiter=limiter,
+            ),
+            timeout=timeout,
+        )
@@ -21,17 +21,15 @@ Adheres to FinTech industry best practices, NumPy-style docstrings, and
 strict PEP 8/257 standards.
 """
 
-import abc
-import typing
-
-import codeforcespy.abc.interactions
 import codeforcespy.abc.objects
 import codeforcespy.features.mixin_base
 
 
-class SyncBlog(codeforcespy.features.mixin_base.SyncFeatureMixin, abc.ABC):
+class SyncBlog(codeforcespy.features.mixin_base.SyncFeatureMixin):
     """Mixin for synchronous blog-related operations."""
 
+    __slots__: tuple[str, ...] = ()
+
     def get_blog_entry_comments(
         self, blog_entry_id: int
     ) -> list[codeforcespy.abc.objects.Comment]:
@@ -53,15 +51,7 @@ class SyncBlog(codeforcespy.features.mixin_base.SyncFeatureMixin, abc.ABC):
         codeforcespy.errors.APIError
             If the API response indicates a failure.
         """
-        endpoint_url: str = self._url_generator.blog_entry_comments(
-            blog_entry_id=blog_entry_id
-        )
-        result = self._execute_request(
-            "blogEntry.comments",
-            endpoint_url,
-            codeforcespy.abc.interactions.BlogEntryCommentResponse,
-        )
-        return typing.cast("list[codeforcespy.abc.objects.Comment]", result)
+        return self._call("blogEntry.comments", blog_entry_id=blog_entry_id)
 
     def get_blog_entry_view(
         self, blog_entry_id: int
@@ -84,20 +74,14 @@ class SyncBlog(codeforcespy.features.mixin_base.SyncFeatureMixin, abc.ABC):
         codeforcespy.errors.APIError
             If the API response indicates a failure.
         """
-        endpoint_url: str = self._url_generator.blog_entry_view(
-            blog_entry_id=blog_entry_id
-        )
-        result = self._execute_request(
-            "blogEntry.view",
-            endpoint_url,
-            codeforcespy.abc.interactions.BlogEntryViewResponse,
-        )
-        return typing.cast("list[codeforcespy.abc.objects.BlogEntry]", result)
-
-
-class AsyncBlog(codeforcespy.features.mixin_base.AsyncFeatureMixin, abc.ABC):
+        return self._call("blogEntry.view", blog_entry_id=blog_entry_id)
+
+
+class AsyncBlog(codeforcespy.features.mixin_base.AsyncFeatureMixin):
     """Mixin for asynchronous blog-related operations."""
 
+    __slots__: tuple[str, ...] = ()
+
     async def get_blog_entry_comments(
         self, blog_entry_id: int
     ) -> list[codeforcespy.abc.objects.Comment]:
@@ -119,15 +103,7 @@ class AsyncBlog(codeforcespy.features.mixin_base.AsyncFeatureMixin, abc.ABC):
         codeforcespy.errors.APIError
             If the API response indicates a failure.
         """
-        endpoint_url: str = self._url_generator.blog_entry_comments(
-            blog_entry_id=blog_entry_id
-        )
-        result = await self._execute_request(
-            "blogEntry.comments",
-            endpoint_url,
-            codeforcespy.abc.interactions.BlogEntryCommentResponse,
-        )
-        return typing.cast("list[codeforcespy.abc.objects.Comment]", result)
+        return await self._call("blogEntry.comments", blog_entry_id=blog_entry_id)
 
     async def get_blog_entry_view(
         self, blog_entry_id: int
@@ -150,12 +126,4 @@ class AsyncBlog(codeforcespy.features.mixin_base.AsyncFeatureMixin, abc.ABC):
         codeforcespy.errors.APIError
             If the API response indicates a failure.
         """
-        endpoint_url: str = self._url_generator.blog_entry_view(
-            blog_entry_id=blog_entry_id
-        )
-        result = await self._execute_request(
-            "blogEntry.view",
-            endpoint_url,
-            codeforcespy.abc.interactions.BlogEntryViewResponse,
-        )
-        return typing.cast("list[codeforcespy.abc.objects.BlogEntry]", result)
+        return await self._call("blogEntry.view", blog_entry_id=blog_entry_id)
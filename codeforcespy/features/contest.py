@@ -22,18 +22,16 @@ Adheres to FinTech industry best practices, NumPy-style docstrings, and
 strict PEP 8/257 standards.
 """
 
-import abc
-import typing
-
 import codeforcespy.abc.cobjects
-import codeforcespy.abc.interactions
 import codeforcespy.abc.objects
 import codeforcespy.features.mixin_base
 
 
-class SyncContest(codeforcespy.features.mixin_base.SyncFeatureMixin, abc.ABC):
+class SyncContest(codeforcespy.features.mixin_base.SyncFeatureMixin):
     """Mixin for synchronous contest-related operations."""
 
+    __slots__: tuple[str, ...] = ()
+
     def get_contest_hacks(
         self, contest_id: int, as_manager: bool | None = False
     ) -> list[codeforcespy.abc.objects.Hack]:
@@ -57,15 +55,7 @@ class SyncContest(codeforcespy.features.mixin_base.SyncFeatureMixin, abc.ABC):
         codeforcespy.errors.APIError
             If the API response indicates a failure.
         """
-        endpoint_url: str = self._url_generator.contest_hacks(
-            contest_id=contest_id, as_manager=as_manager
-        )
-        result = self._execute_request(
-            "contest.hacks",
-            endpoint_url,
-            codeforcespy.abc.interactions.ContestHacksResponse,
-        )
-        return typing.cast("list[codeforcespy.abc.objects.Hack]", result)
+        return self._call("contest.hacks", contest_id=contest_id, as_manager=as_manager)
 
     def get_contest_list(
         self, of_gym: bool | None = False
@@ -88,13 +78,7 @@ class SyncContest(codeforcespy.features.mixin_base.SyncFeatureMixin, abc.ABC):
         codeforcespy.errors.APIError
             If the API response indicates a failure.
         """
-        endpoint_url: str = self._url_generator.contest_list(gym=of_gym)
-        result = self._execute_request(
-            "contest.list",
-            endpoint_url,
-            codeforcespy.abc.interactions.ContestListResponse,
-        )
-        return typing.cast("list[codeforcespy.abc.objects.Contest]", result)
+        return self._call("contest.list", gym=of_gym)
 
     def get_contest_rating_changes(
         self, contest_id: int
@@ -117,15 +101,7 @@ class SyncContest(codeforcespy.features.mixin_base.SyncFeatureMixin, abc.ABC):
         codeforcespy.errors.APIError
             If the API response indicates a failure.
         """
-        endpoint_url: str = self._url_generator.contest_rating_changes(
-            contest_id=contest_id
-        )
-        result = self._execute_request(
-            "contest.ratingChanges",
-            endpoint_url,
-            codeforcespy.abc.interactions.ContestRatingChangeResponse,
-        )
-        return typing.cast("list[codeforcespy.abc.objects.RatingChange]", result)
+        return self._call("contest.ratingChanges", contest_id=contest_id)
 
     def get_contest_standings(
         self,
@@ -161,19 +137,14 @@ class SyncContest(codeforcespy.features.mixin_base.SyncFeatureMixin, abc.ABC):
         codeforcespy.errors.APIError
             If the API response indicates a failure.
         """
-        endpoint_url: str = self._url_generator.contest_standings(
+        return self._call(
+            "contest.standings",
             contest_id=contest_id,
             as_manager=as_manager,
             from_index=from_index,
             count=count,
             show_unofficial=show_unofficial,
         )
-        result = self._execute_request(
-            "contest.standings",
-            endpoint_url,
-            codeforcespy.abc.interactions.ContestStandingResponse,
-        )
-        return typing.cast("list[codeforcespy.abc.cobjects.Standings]", result)
 
     def get_contest_status(
         self,
@@ -209,24 +180,21 @@ class SyncContest(codeforcespy.features.mixin_base.SyncFeatureMixin, abc.ABC):
         codeforcespy.errors.APIError
             If the API response indicates a failure.
         """
-        endpoint_url: str = self._url_generator.contest_status(
+        return self._call(
+            "contest.status",
             contest_id=contest_id,
             as_manager=as_manager,
             handle=handle,
             from_index=from_index,
             count=count,
         )
-        result = self._execute_request(
-            "contest.status",
-            endpoint_url,
-            codeforcespy.abc.interactions.ContestStatusResponse,
-        )
-        return typing.cast("list[codeforcespy.abc.objects.Submission]", result)
 
 
-class AsyncContest(codeforcespy.features.mixin_base.AsyncFeatureMixin, abc.ABC):
+class AsyncContest(codeforcespy.features.mixin_base.AsyncFeatureMixin):
     """Mixin for asynchronous contest-related operations."""
 
+    __slots__: tuple[str, ...] = ()
+
     async def get_contest_hacks(
         self, contest_id: int, as_manager: bool | None = False
     ) -> list[codeforcespy.abc.objects.Hack]:
@@ -250,15 +218,9 @@ class AsyncContest(codeforcespy.features.mixin_base.AsyncFeatureMixin, abc.ABC):
         codeforcespy.errors.APIError
             If the API response indicates a failure.
         """
-        endpoint_url: str = self._url_generator.contest_hacks(
-            contest_id=contest_id, as_manager=as_manager
-        )
-        result = await self._execute_request(
-            "contest.hacks",
-            endpoint_url,
-            codeforcespy.abc.interactions.ContestHacksResponse,
+        return await self._call(
+            "contest.hacks", contest_id=contest_id, as_manager=as_manager
         )
-        return typing.cast("list[codeforcespy.abc.objects.Hack]", result)
 
     async def get_contest_list(
         self, of_gym: bool | None = False
@@ -281,13 +243,7 @@ class AsyncContest(codeforcespy.features.mixin_base.AsyncFeatureMixin, abc.ABC):
         codeforcespy.errors.APIError
             If the API response indicates a failure.
         """
-        endpoint_url: str = self._url_generator.contest_list(gym=of_gym)
-        result = await self._execute_request(
-            "contest.list",
-            endpoint_url,
-            codeforcespy.abc.interactions.ContestListResponse,
-        )
-        return typing.cast("list[codeforcespy.abc.objects.Contest]", result)
+        return await self._call("contest.list", gym=of_gym)
 
     async def get_contest_rating_changes(
         self, contest_id: int
@@ -310,15 +266,7 @@ class AsyncContest(codeforcespy.features.mixin_base.AsyncFeatureMixin, abc.ABC):
         codeforcespy.errors.APIError
             If the API response indicates a failure.
         """
-        endpoint_url: str = self._url_generator.contest_rating_changes(
-            contest_id=contest_id
-        )
-        result = await self._execute_request(
-            "contest.ratingChanges",
-            endpoint_url,
-            codeforcespy.abc.interactions.ContestRatingChangeResponse,
-        )
-        return typing.cast("list[codeforcespy.abc.objects.RatingChange]", result)
+        return await self._call("contest.ratingChanges", contest_id=contest_id)
 
     async def get_contest_standings(
         self,
@@ -354,19 +302,14 @@ class AsyncContest(codeforcespy.features.mixin_base.AsyncFeatureMixin, abc.ABC):
         codeforcespy.errors.APIError
             If the API response indicates a failure.
         """
-        endpoint_url: str = self._url_generator.contest_standings(
+        return await self._call(
+            "contest.standings",
             contest_id=contest_id,
             as_manager=as_manager,
             from_index=from_index,
             count=count,
             show_unofficial=show_unofficial,
         )
-        result = await self._execute_request(
-            "contest.standings",
-            endpoint_url,
-            codeforcespy.abc.interactions.ContestStandingResponse,
-        )
-        return typing.cast("list[codeforcespy.abc.cobjects.Standings]", result)
 
     async def get_contest_status(
         self,
@@ -402,16 +345,11 @@ class AsyncContest(codeforcespy.features.mixin_base.AsyncFeatureMixin, abc.ABC):
         codeforcespy.errors.APIError
             If the API response indicates a failure.
         """
-        endpoint_url: str = self._url_generator.contest_status(
+        return await self._call(
+            "contest.status",
             contest_id=contest_id,
             as_manager=as_manager,
             handle=handle,
             from_index=from_index,
             count=count,
         )
-        result = await self._execute_request(
-            "contest.status",
-            endpoint_url,
-            codeforcespy.abc.interactions.ContestStatusResponse,
-        )
-        return typing.cast("list[codeforcespy.abc.objects.Submission]", result)
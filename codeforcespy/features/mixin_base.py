@@ -9,7 +9,10 @@ Base classes for synchronizing and asynchronous feature implementation.
 - 🏗️ FeatureMixin: Common base for all feature modules.
 - 🔄 SyncFeatureMixin: Base for synchronous implementations.
 - ⚡ AsyncFeatureMixin: Base for asynchronous implementations.
-- 🔌 Abstract Methods: Defines `_execute_request` contract.
+- 🔌 Request Contract: Defines `_execute_request`, implemented by the
+  concrete clients.
+- 🗺️ Dispatch Table: `_METHOD_TABLE` maps every API method to its URL
+  builder and response class, so endpoint wrappers share one `_call` body.
 
 📝 Compliance
 -----------------
@@ -17,44 +20,196 @@ Adheres to FinTech industry best practices, NumPy-style docstrings, and
 strict PEP 8/257 standards.
 """
 
-import abc
 import typing
 
-if typing.TYPE_CHECKING:
-    import codeforcespy.abc.endpoints
-    import codeforcespy.abc.protocols
+import codeforcespy.abc.endpoints
+import codeforcespy.abc.interactions
+import codeforcespy.abc.protocols
 
+_METHOD_TABLE: dict[
+    "codeforcespy.abc.endpoints.MethodName",
+    tuple[str, type["codeforcespy.abc.protocols.ResponseProtocol"]],
+] = {
+    "blogEntry.comments": (
+        "blog_entry_comments",
+        codeforcespy.abc.interactions.BlogEntryCommentResponse,
+    ),
+    "blogEntry.view": (
+        "blog_entry_view",
+        codeforcespy.abc.interactions.BlogEntryViewResponse,
+    ),
+    "contest.hacks": (
+        "contest_hacks",
+        codeforcespy.abc.interactions.ContestHacksResponse,
+    ),
+    "contest.list": (
+        "contest_list",
+        codeforcespy.abc.interactions.ContestListResponse,
+    ),
+    "contest.ratingChanges": (
+        "contest_rating_changes",
+        codeforcespy.abc.interactions.ContestRatingChangeResponse,
+    ),
+    "contest.standings": (
+        "contest_standings",
+        codeforcespy.abc.interactions.ContestStandingResponse,
+    ),
+    "contest.status": (
+        "contest_status",
+        codeforcespy.abc.interactions.ContestStatusResponse,
+    ),
+    "problemset.problems": (
+        "problemset_problems",
+        codeforcespy.abc.interactions.ProblemSetProblemsResponse,
+    ),
+    "problemset.recentStatus": (
+        "problemset_recent_status",
+        codeforcespy.abc.interactions.ProblemSetRecentStatusResponse,
+    ),
+    "recentActions": (
+        "recent_actions",
+        codeforcespy.abc.interactions.RecentActionsResponse,
+    ),
+    "user.blogEntries": (
+        "user_blog_entries",
+        codeforcespy.abc.interactions.UserBlogEntryResponse,
+    ),
+    "user.friends": (
+        "user_friends",
+        codeforcespy.abc.interactions.UserFriendResponse,
+    ),
+    "user.info": (
+        "user_info",
+        codeforcespy.abc.interactions.UserInteractionResponse,
+    ),
+    "user.ratedList": (
+        "user_rated_list",
+        codeforcespy.abc.interactions.UserRatedListResponse,
+    ),
+    "user.rating": (
+        "user_rating",
+        codeforcespy.abc.interactions.UserRatingResponse,
+    ),
+    "user.status": (
+        "user_status",
+        codeforcespy.abc.interactions.UserStatusResponse,
+    ),
+}
+"""`CodeForcesAPI` builder name and response class of every API method."""
 
-class FeatureMixin(abc.ABC):
-    """Base class for all feature mixins."""
+
+class FeatureMixin:
+    """
+    Base class for all feature mixins.
+
+    The mixins are plain classes rather than ``abc.ABC`` subclasses: the
+    request contract is only needed statically, so ABCMeta's instance and
+    subclass-check machinery is kept out of the client MRO.
+    """
+
+    __slots__: tuple[str, ...] = ()
 
     if typing.TYPE_CHECKING:
         _url_generator: "codeforcespy.abc.endpoints.CodeForcesAPI"
 
 
-class SyncFeatureMixin(FeatureMixin, abc.ABC):
+class SyncFeatureMixin(FeatureMixin):
     """Base class for synchronous feature mixins."""
 
-    @abc.abstractmethod
+    __slots__: tuple[str, ...] = ()
+
     def _execute_request(
         self,
         method_name: str,
         endpoint_url: str,
         response_cls: type["codeforcespy.abc.protocols.ResponseProtocol"],
-    ) -> list[object]:
-        """Abstract method for executing synchronous requests."""
-        ...
+    ) -> list[typing.Any]:
+        """
+        Execute a synchronous request; implemented by the concrete client.
+
+        Raises
+        ------
+        NotImplementedError
+            Always, unless overridden by the concrete client.
+        """
+        raise NotImplementedError
+
+    def _call(
+        self,
+        method_name: "codeforcespy.abc.endpoints.MethodName",
+        **params: typing.Any,
+    ) -> list[typing.Any]:
+        """
+        Build the endpoint URL of an API method and execute the request.
+
+        Parameters
+        ----------
+        method_name : MethodName
+            The API method name, a key of `_METHOD_TABLE`.
+        **params : Any
+            Keyword arguments of the method's `CodeForcesAPI` URL builder.
+
+        Returns
+        -------
+        list[Any]
+            The decoded result wrapped as a list.
 
+        Raises
+        ------
+        codeforcespy.errors.APIError
+            If the API response indicates a failure.
+        """
+        builder, response_cls = _METHOD_TABLE[method_name]
+        endpoint_url: str = getattr(self._url_generator, builder)(**params)
+        return self._execute_request(method_name, endpoint_url, response_cls)
 
-class AsyncFeatureMixin(FeatureMixin, abc.ABC):
+
+class AsyncFeatureMixin(FeatureMixin):
     """Base class for asynchronous feature mixins."""
 
-    @abc.abstractmethod
+    __slots__: tuple[str, ...] = ()
+
     async def _execute_request(
         self,
         method_name: str,
         endpoint_url: str,
         response_cls: type["codeforcespy.abc.protocols.ResponseProtocol"],
-    ) -> list[object]:
-        """Abstract method for executing asynchronous requests."""
-        ...
+    ) -> list[typing.Any]:
+        """
+        Execute an asynchronous request; implemented by the concrete client.
+
+        Raises
+        ------
+        NotImplementedError
+            Always, unless overridden by the concrete client.
+        """
+        raise NotImplementedError
+
+    async def _call(
+        self,
+        method_name: "codeforcespy.abc.endpoints.MethodName",
+        **params: typing.Any,
+    ) -> list[typing.Any]:
+        """
+        Build the endpoint URL of an API method and await the request.
+
+        Parameters
+        ----------
+        method_name : MethodName
+            The API method name, a key of `_METHOD_TABLE`.
+        **params : Any
+            Keyword arguments of the method's `CodeForcesAPI` URL builder.
+
+        Returns
+        -------
+        list[Any]
+            The decoded result wrapped as a list.
+
+        Raises
+        ------
+        codeforcespy.errors.APIError
+            If the API response indicates a failure.
+        """
+        builder, response_cls = _METHOD_TABLE[method_name]
+        endpoint_url: str = getattr(self._url_generator, builder)(**params)
+        return await self._execute_request(method_name, endpoint_url, response_cls)
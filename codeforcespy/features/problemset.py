@@ -21,18 +21,16 @@ Adheres to FinTech industry best practices, NumPy-style docstrings, and
 strict PEP 8/257 standards.
 """
 
-import abc
-import typing
-
 import codeforcespy.abc.cobjects
-import codeforcespy.abc.interactions
 import codeforcespy.abc.objects
 import codeforcespy.features.mixin_base
 
 
-class SyncProblemset(codeforcespy.features.mixin_base.SyncFeatureMixin, abc.ABC):
+class SyncProblemset(codeforcespy.features.mixin_base.SyncFeatureMixin):
     """Mixin for synchronous problemset-related operations."""
 
+    __slots__: tuple[str, ...] = ()
+
     def get_problemset_problems(
         self, tags: str | None = None, problemset_name: str | None = None
     ) -> list[codeforcespy.abc.cobjects.ProblemSetProblems]:
@@ -56,15 +54,9 @@ class SyncProblemset(codeforcespy.features.mixin_base.SyncFeatureMixin, abc.ABC)
         codeforcespy.errors.APIError
             If the API response indicates a failure.
         """
-        endpoint_url: str = self._url_generator.problemset_problems(
-            tags=tags, problemset_name=problemset_name
+        return self._call(
+            "problemset.problems", tags=tags, problemset_name=problemset_name
         )
-        result = self._execute_request(
-            "problemset.problems",
-            endpoint_url,
-            codeforcespy.abc.interactions.ProblemSetProblemsResponse,
-        )
-        return typing.cast("list[codeforcespy.abc.cobjects.ProblemSetProblems]", result)
 
     def get_problemset_recent_status(
         self, count: int, problemset_name: str | None = None
@@ -89,20 +81,16 @@ class SyncProblemset(codeforcespy.features.mixin_base.SyncFeatureMixin, abc.ABC)
         codeforcespy.errors.APIError
             If the API response indicates a failure.
         """
-        endpoint_url: str = self._url_generator.problemset_recent_status(
-            count=count, problemset_name=problemset_name
-        )
-        result = self._execute_request(
-            "problemset.recentStatus",
-            endpoint_url,
-            codeforcespy.abc.interactions.ProblemSetRecentStatusResponse,
+        return self._call(
+            "problemset.recentStatus", count=count, problemset_name=problemset_name
         )
-        return typing.cast("list[codeforcespy.abc.objects.Submission]", result)
 
 
-class AsyncProblemset(codeforcespy.features.mixin_base.AsyncFeatureMixin, abc.ABC):
+class AsyncProblemset(codeforcespy.features.mixin_base.AsyncFeatureMixin):
     """Mixin for asynchronous problemset-related operations."""
 
+    __slots__: tuple[str, ...] = ()
+
     async def get_problemset_problems(
         self, tags: str | None = None, problemset_name: str | None = None
     ) -> list[codeforcespy.abc.cobjects.ProblemSetProblems]:
@@ -126,15 +114,9 @@ class AsyncProblemset(codeforcespy.features.mixin_base.AsyncFeatureMixin, abc.AB
         codeforcespy.errors.APIError
             If the API response indicates a failure.
         """
-        endpoint_url: str = self._url_generator.problemset_problems(
-            tags=tags, problemset_name=problemset_name
-        )
-        result = await self._execute_request(
-            "problemset.problems",
-            endpoint_url,
-            codeforcespy.abc.interactions.ProblemSetProblemsResponse,
+        return await self._call(
+            "problemset.problems", tags=tags, problemset_name=problemset_name
         )
-        return typing.cast("list[codeforcespy.abc.cobjects.ProblemSetProblems]", result)
 
     async def get_problemset_recent_status(
         self, count: int, problemset_name: str | None = None
@@ -159,12 +141,6 @@ class AsyncProblemset(codeforcespy.features.mixin_base.AsyncFeatureMixin, abc.AB
         codeforcespy.errors.APIError
             If the API response indicates a failure.
         """
-        endpoint_url: str = self._url_generator.problemset_recent_status(
-            count=count, problemset_name=problemset_name
-        )
-        result = await self._execute_request(
-            "problemset.recentStatus",
-            endpoint_url,
-            codeforcespy.abc.interactions.ProblemSetRecentStatusResponse,
+        return await self._call(
+            "problemset.recentStatus", count=count, problemset_name=problemset_name
         )
-        return typing.cast("list[codeforcespy.abc.objects.Submission]", result)
@@ -20,17 +20,15 @@ Adheres to FinTech industry best practices, NumPy-style docstrings, and
 strict PEP 8/257 standards.
 """
 
-import abc
-import typing
-
-import codeforcespy.abc.interactions
 import codeforcespy.abc.objects
 import codeforcespy.features.mixin_base
 
 
-class SyncRecent(codeforcespy.features.mixin_base.SyncFeatureMixin, abc.ABC):
+class SyncRecent(codeforcespy.features.mixin_base.SyncFeatureMixin):
     """Mixin for synchronous recent action-related operations."""
 
+    __slots__: tuple[str, ...] = ()
+
     def get_recent_actions(
         self, max_count: int
     ) -> list[codeforcespy.abc.objects.RecentAction]:
@@ -52,18 +50,14 @@ class SyncRecent(codeforcespy.features.mixin_base.SyncFeatureMixin, abc.ABC):
         codeforcespy.errors.APIError
             If the API response indicates a failure.
         """
-        endpoint_url: str = self._url_generator.recent_actions(max_count=max_count)
-        result = self._execute_request(
-            "recentActions",
-            endpoint_url,
-            codeforcespy.abc.interactions.RecentActionsResponse,
-        )
-        return typing.cast("list[codeforcespy.abc.objects.RecentAction]", result)
+        return self._call("recentActions", max_count=max_count)
 
 
-class AsyncRecent(codeforcespy.features.mixin_base.AsyncFeatureMixin, abc.ABC):
+class AsyncRecent(codeforcespy.features.mixin_base.AsyncFeatureMixin):
     """Mixin for asynchronous recent action-related operations."""
 
+    __slots__: tuple[str, ...] = ()
+
     async def get_recent_actions(
         self, max_count: int
     ) -> list[codeforcespy.abc.objects.RecentAction]:
@@ -85,10 +79,4 @@ class AsyncRecent(codeforcespy.features.mixin_base.AsyncFeatureMixin, abc.ABC):
         codeforcespy.errors.APIError
             If the API response indicates a failure.
         """
-        endpoint_url: str = self._url_generator.recent_actions(max_count=max_count)
-        result = await self._execute_request(
-            "recentActions",
-            endpoint_url,
-            codeforcespy.abc.interactions.RecentActionsResponse,
-        )
-        return typing.cast("list[codeforcespy.abc.objects.RecentAction]", result)
+        return await self._call("recentActions", max_count=max_count)
@@ -6,7 +6,8 @@ Domain-specific logic for user-related API endpoints.
 
 ✨ Capabilities
 -------------------
-- 📋 User Info: Retrieve detailed user profiles and rankings.
+- 📋 User Info: Retrieve detailed user profiles and rankings, including
+  bulk lookups packed into as few requests as possible.
 - 📉 Ratings: Access user rating changes and history.
 - 🚦 Status: Get user submissions and status updates.
 
@@ -21,17 +22,79 @@ Adheres to FinTech industry best practices, NumPy-style docstrings, and
 strict PEP 8/257 standards.
 """
 
-import abc
+import asyncio
+import collections.abc
 import typing
 
-import codeforcespy.abc.interactions
 import codeforcespy.abc.objects
+import codeforcespy.base
+import codeforcespy.batching
 import codeforcespy.features.mixin_base
 
 
-class SyncUser(codeforcespy.features.mixin_base.SyncFeatureMixin, abc.ABC):
+def _indexed_users(
+    index: dict[str, codeforcespy.abc.objects.User], handles: str
+) -> list[codeforcespy.abc.objects.User] | None:
+    """
+    Serve a lookup from the rated-list index if every handle is known.
+
+    Parameters
+    ----------
+    index : dict[str, codeforcespy.abc.objects.User]
+        Users of the last rated-list snapshot by handle.
+    handles : str
+        Semicolon-separated list of user handles.
+
+    Returns
+    -------
+    list[codeforcespy.abc.objects.User] | None
+        The indexed users in request order, or None if any handle is missing.
+    """
+    if not index:
+        return None
+    users: list[codeforcespy.abc.objects.User] = []
+    for handle in handles.split(";"):
+        user = index.get(handle)
+        if user is None:
+            return None
+        users.append(user)
+    return users
+
+
+def _handle_chunks(
+    handles: collections.abc.Iterable[str], chunk_size: int
+) -> list[str]:
+    """
+    Pack handles into semicolon-joined ``user.info`` arguments.
+
+    Parameters
+    ----------
+    handles : Iterable[str]
+        User handles.
+    chunk_size : int
+        The maximum number of handles per chunk.
+
+    Returns
+    -------
+    list[str]
+        Semicolon-separated handle lists of at most `chunk_size` handles.
+    """
+    handles = list(handles)
+    return [
+        ";".join(handles[i : i + chunk_size])
+        for i in range(0, len(handles), chunk_size)
+    ]
+
+
+class SyncUser(codeforcespy.features.mixin_base.SyncFeatureMixin):
     """Mixin for synchronous user-related operations."""
 
+    __slots__: tuple[str, ...] = ()
+
+    if typing.TYPE_CHECKING:
+        _user_info_batcher: "codeforcespy.batching.SyncUserInfoBatcher"
+        _rated_index: dict[str, codeforcespy.abc.objects.User]
+
     def get_user(
         self, handles: str, check_historic_handles: bool | None = True
     ) -> list[codeforcespy.abc.objects.User]:
@@ -54,16 +117,131 @@ class SyncUser(codeforcespy.features.mixin_base.SyncFeatureMixin, abc.ABC):
         ------
         codeforcespy.errors.APIError
             If the API response indicates a failure.
+
+        Notes
+        -----
+        Lookups issued concurrently from several threads within a few milliseconds
+        are coalesced into a single ``user.info`` request. After
+        `prime_rated_index`, lookups with `check_historic_handles` set whose
+        handles are all indexed are answered without a request.
         """
-        endpoint_url: str = self._url_generator.user_info(
-            handles=handles, check_historic_handles=check_historic_handles
-        )
-        result = self._execute_request(
-            "user.info",
-            endpoint_url,
-            codeforcespy.abc.interactions.UserInteractionResponse,
+        if check_historic_handles:
+            indexed = _indexed_users(self._rated_index, handles)
+            if indexed is not None:
+                return indexed
+        return self._user_info_batcher.submit(handles, check_historic_handles)
+
+    def get_user_single(
+        self, handle: str, check_historic_handles: bool | None = True
+    ) -> codeforcespy.abc.objects.User | None:
+        """
+        Retrieve user information for a single handle.
+
+        Goes through the same rated-list index, coalescing and caching as
+        `get_user`, but spares callers the list handling.
+
+        Parameters
+        ----------
+        handle : str
+            The Codeforces user handle.
+        check_historic_handles : bool | None, optional
+            Whether to check historic handles (default is True).
+
+        Returns
+        -------
+        codeforcespy.abc.objects.User | None
+            The user, or None if the API returned no user.
+
+        Raises
+        ------
+        codeforcespy.errors.APIError
+            If the API response indicates a failure.
+        """
+        users = self.get_user(handle, check_historic_handles)
+        return users[0] if users else None
+
+    def get_users_bulk(
+        self,
+        handles: collections.abc.Iterable[str],
+        check_historic_handles: bool | None = True,
+        chunk_size: int = codeforcespy.batching.MAX_HANDLES_PER_REQUEST,
+    ) -> list[codeforcespy.abc.objects.User]:
+        """
+        Retrieve users for many handles in as few requests as possible.
+
+        Handles are packed into ``user.info`` requests of `chunk_size`
+        handles each, so N handles cost ``ceil(N / chunk_size)`` round trips
+        instead of N. Larger chunks mean fewer requests but longer URLs; the
+        default keeps URLs well under the server's length limit.
+
+        Parameters
+        ----------
+        handles : Iterable[str]
+            The Codeforces user handles.
+        check_historic_handles : bool | None, optional
+            Whether to check historic handles (default is True).
+        chunk_size : int, optional
+            The maximum number of handles per request (default is
+            `codeforcespy.batching.MAX_HANDLES_PER_REQUEST`).
+
+        Returns
+        -------
+        list[codeforcespy.abc.objects.User]
+            The users, in the order of `handles`.
+
+        Raises
+        ------
+        codeforcespy.errors.APIError
+            If the API response indicates a failure.
+        """
+        return [
+            user
+            for chunk in _handle_chunks(handles, chunk_size)
+            for user in self.get_user(chunk, check_historic_handles)
+        ]
+
+    def prime_rated_index(self) -> int:
+        """
+        Load the full rated list into a local handle index.
+
+        Subsequent `get_user` calls for indexed handles are answered from
+        memory; call again to refresh the snapshot.
+
+        Returns
+        -------
+        int
+            The number of indexed users.
+
+        Raises
+        ------
+        codeforcespy.errors.APIError
+            If the API response indicates a failure.
+        """
+        users = self.get_user_rated_list(active_only=False, include_retired=True)
+        self._rated_index = {user.handle: user for user in users}
+        return len(self._rated_index)
+
+    def _lookup_users(
+        self, handles: str, check_historic_handles: bool | None
+    ) -> list[codeforcespy.abc.objects.User]:
+        """
+        Issue one ``user.info`` request; used by the lookup batcher.
+
+        Parameters
+        ----------
+        handles : str
+            Semicolon-separated list of user handles.
+        check_historic_handles : bool | None
+            Whether to check historic handles.
+
+        Returns
+        -------
+        list[codeforcespy.abc.objects.User]
+            A list of user objects.
+        """
+        return self._call(
+            "user.info", handles=handles, check_historic_handles=check_historic_handles
         )
-        return typing.cast("list[codeforcespy.abc.objects.User]", result)
 
     def get_user_blog_entries(
         self, handle: str
@@ -86,13 +264,7 @@ class SyncUser(codeforcespy.features.mixin_base.SyncFeatureMixin, abc.ABC):
         codeforcespy.errors.APIError
             If the API response indicates a failure.
         """
-        endpoint_url: str = self._url_generator.user_blog_entries(handle=handle)
-        result = self._execute_request(
-            "user.blogEntries",
-            endpoint_url,
-            codeforcespy.abc.interactions.UserBlogEntryResponse,
-        )
-        return typing.cast("list[codeforcespy.abc.objects.BlogEntry]", result)
+        return self._call("user.blogEntries", handle=handle)
 
     def get_user_friends(self, only_online: bool = True) -> list[str]:
         """
@@ -113,13 +285,7 @@ class SyncUser(codeforcespy.features.mixin_base.SyncFeatureMixin, abc.ABC):
         codeforcespy.errors.APIError
             If the API response indicates a failure.
         """
-        endpoint_url: str = self._url_generator.user_friends(only_online=only_online)
-        result = self._execute_request(
-            "user.friends",
-            endpoint_url,
-            codeforcespy.abc.interactions.UserFriendResponse,
-        )
-        return typing.cast("list[str]", result)
+        return self._call("user.friends", only_online=only_online)
 
     def get_user_rated_list(
         self,
@@ -149,17 +315,12 @@ class SyncUser(codeforcespy.features.mixin_base.SyncFeatureMixin, abc.ABC):
         codeforcespy.errors.APIError
             If the API response indicates a failure.
         """
-        endpoint_url: str = self._url_generator.user_rated_list(
+        return self._call(
+            "user.ratedList",
             active_only=active_only,
             include_retired=include_retired,
             contest_id=contest_id,
         )
-        result = self._execute_request(
-            "user.ratedList",
-            endpoint_url,
-            codeforcespy.abc.interactions.UserRatedListResponse,
-        )
-        return typing.cast("list[codeforcespy.abc.objects.User]", result)
 
     def get_user_rating(
         self, handle: str
@@ -182,13 +343,33 @@ class SyncUser(codeforcespy.features.mixin_base.SyncFeatureMixin, abc.ABC):
         codeforcespy.errors.APIError
             If the API response indicates a failure.
         """
-        endpoint_url: str = self._url_generator.user_rating(handle=handle)
-        result = self._execute_request(
-            "user.rating",
-            endpoint_url,
-            codeforcespy.abc.interactions.UserRatingResponse,
-        )
-        return typing.cast("list[codeforcespy.abc.objects.RatingChange]", result)
+        return self._call("user.rating", handle=handle)
+
+    def get_users_ratings_bulk(
+        self, handles: collections.abc.Iterable[str]
+    ) -> dict[str, list[codeforcespy.abc.objects.RatingChange]]:
+        """
+        Retrieve the rating histories of several users.
+
+        ``user.rating`` accepts a single handle, so one request is issued per
+        handle.
+
+        Parameters
+        ----------
+        handles : Iterable[str]
+            The Codeforces user handles.
+
+        Returns
+        -------
+        dict[str, list[codeforcespy.abc.objects.RatingChange]]
+            Rating changes by handle, in the order of `handles`.
+
+        Raises
+        ------
+        codeforcespy.errors.APIError
+            If any API response indicates a failure.
+        """
+        return {handle: self.get_user_rating(handle) for handle in handles}
 
     def get_user_status(
         self, handle: str, from_index: int = 1, count: int = 10
@@ -215,20 +396,68 @@ class SyncUser(codeforcespy.features.mixin_base.SyncFeatureMixin, abc.ABC):
         codeforcespy.errors.APIError
             If the API response indicates a failure.
         """
-        endpoint_url: str = self._url_generator.user_status(
-            handle=handle, from_index=from_index, count=count
+        return self._call(
+            "user.status", handle=handle, from_index=from_index, count=count
         )
-        result = self._execute_request(
-            "user.status",
-            endpoint_url,
-            codeforcespy.abc.interactions.UserStatusResponse,
-        )
-        return typing.cast("list[codeforcespy.abc.objects.Submission]", result)
 
+    def get_user_status_stream(
+        self,
+        handle: str,
+        from_index: int = 1,
+        count: int | None = None,
+        page_size: int = 1000,
+    ) -> collections.abc.Iterator[codeforcespy.abc.objects.Submission]:
+        """
+        Stream a user's submissions page by page.
+
+        Only one page of submissions is held in memory at a time, which keeps
+        long histories cheap to walk compared to one large `get_user_status`.
+
+        Parameters
+        ----------
+        handle : str
+            The Codeforces user handle.
+        from_index : int, optional
+            The starting index for submissions (default is 1).
+        count : int | None, optional
+            The number of submissions to yield; None yields all of them
+            (default is None).
+        page_size : int, optional
+            The number of submissions fetched per request (default is 1000).
 
-class AsyncUser(codeforcespy.features.mixin_base.AsyncFeatureMixin, abc.ABC):
+        Yields
+        ------
+        codeforcespy.abc.objects.Submission
+            Submission objects, newest first.
+
+        Raises
+        ------
+        codeforcespy.errors.APIError
+            If the API response indicates a failure.
+        """
+        remaining = count
+        while remaining is None or remaining > 0:
+            size = page_size if remaining is None else min(page_size, remaining)
+            page = self.get_user_status(handle, from_index, size)
+            yield from page
+            if len(page) < size:
+                return
+            from_index += size
+            if remaining is not None:
+                remaining -= size
+
+
+class AsyncUser(codeforcespy.features.mixin_base.AsyncFeatureMixin):
     """Mixin for asynchronous user-related operations."""
 
+    __slots__: tuple[str, ...] = ()
+
+    if typing.TYPE_CHECKING:
+        _user_info_batcher: "codeforcespy.batching.AsyncUserInfoBatcher"
+        _rated_index: dict[str, codeforcespy.abc.objects.User]
+        _background_tasks: set["asyncio.Task[None]"]
+        _rated_index_task: "asyncio.Task[None] | None"
+
     async def get_user(
         self, handles: str, check_historic_handles: bool | None = True
     ) -> list[codeforcespy.abc.objects.User]:
@@ -251,16 +480,167 @@ class AsyncUser(codeforcespy.features.mixin_base.AsyncFeatureMixin, abc.ABC):
         ------
         codeforcespy.errors.APIError
             If the API response indicates a failure.
+
+        Notes
+        -----
+        Lookups issued concurrently within a few milliseconds
+        are coalesced into a single ``user.info`` request. After
+        `prime_rated_index`, lookups with `check_historic_handles` set whose
+        handles are all indexed are answered without a request.
+        """
+        if check_historic_handles:
+            indexed = _indexed_users(self._rated_index, handles)
+            if indexed is not None:
+                return indexed
+        return await self._user_info_batcher.submit(handles, check_historic_handles)
+
+    async def get_user_single(
+        self, handle: str, check_historic_handles: bool | None = True
+    ) -> codeforcespy.abc.objects.User | None:
+        """
+        Asynchronously retrieve user information for a single handle.
+
+        Goes through the same rated-list index, coalescing and caching as
+        `get_user`, but spares callers the list handling.
+
+        Parameters
+        ----------
+        handle : str
+            The Codeforces user handle.
+        check_historic_handles : bool | None, optional
+            Whether to check historic handles (default is True).
+
+        Returns
+        -------
+        codeforcespy.abc.objects.User | None
+            The user, or None if the API returned no user.
+
+        Raises
+        ------
+        codeforcespy.errors.APIError
+            If the API response indicates a failure.
+        """
+        users = await self.get_user(handle, check_historic_handles)
+        return users[0] if users else None
+
+    async def get_users_bulk(
+        self,
+        handles: collections.abc.Iterable[str],
+        check_historic_handles: bool | None = True,
+        chunk_size: int = codeforcespy.batching.MAX_HANDLES_PER_REQUEST,
+    ) -> list[codeforcespy.abc.objects.User]:
         """
-        endpoint_url: str = self._url_generator.user_info(
-            handles=handles, check_historic_handles=check_historic_handles
+        Asynchronously retrieve users for many handles in few requests.
+
+        Handles are packed into ``user.info`` requests of `chunk_size`
+        handles each, so N handles cost ``ceil(N / chunk_size)`` round trips
+        instead of N; the chunks are requested concurrently. Larger chunks
+        mean fewer requests but longer URLs; the default keeps URLs well
+        under the server's length limit.
+
+        Parameters
+        ----------
+        handles : Iterable[str]
+            The Codeforces user handles.
+        check_historic_handles : bool | None, optional
+            Whether to check historic handles (default is True).
+        chunk_size : int, optional
+            The maximum number of handles per request (default is
+            `codeforcespy.batching.MAX_HANDLES_PER_REQUEST`).
+
+        Returns
+        -------
+        list[codeforcespy.abc.objects.User]
+            The users, in the order of `handles`.
+
+        Raises
+        ------
+        codeforcespy.errors.APIError
+            If the API response indicates a failure.
+        """
+        pages = await asyncio.gather(
+            *(
+                self.get_user(chunk, check_historic_handles)
+                for chunk in _handle_chunks(handles, chunk_size)
+            )
         )
-        result = await self._execute_request(
-            "user.info",
-            endpoint_url,
-            codeforcespy.abc.interactions.UserInteractionResponse,
+        return [user for page in pages for user in page]
+
+    async def prime_rated_index(self, refresh_seconds: float | None = None) -> int:
+        """
+        Asynchronously load the full rated list into a local handle index.
+
+        Subsequent `get_user` calls for indexed handles are answered from
+        memory.
+
+        Parameters
+        ----------
+        refresh_seconds : float | None, optional
+            If given, reload the index in a background task at this interval
+            until the client is closed (default is None). A reload task
+            started by an earlier call is cancelled first.
+
+        Returns
+        -------
+        int
+            The number of indexed users.
+
+        Raises
+        ------
+        codeforcespy.errors.APIError
+            If the API response indicates a failure.
+        """
+        users = await self.get_user_rated_list(active_only=False, include_retired=True)
+        self._rated_index = {user.handle: user for user in users}
+        if refresh_seconds is not None:
+            if self._rated_index_task is not None:
+                _ = self._rated_index_task.cancel()
+            task = asyncio.create_task(self._refresh_rated_index(refresh_seconds))
+            self._rated_index_task = task
+            self._background_tasks.add(task)
+            task.add_done_callback(self._background_tasks.discard)
+        return len(self._rated_index)
+
+    async def _refresh_rated_index(self, refresh_seconds: float) -> None:
+        """
+        Reload the rated-list index periodically; runs as a background task.
+
+        Parameters
+        ----------
+        refresh_seconds : float
+            Seconds between reloads.
+        """
+        while True:
+            await asyncio.sleep(refresh_seconds)
+            try:
+                users = await self.get_user_rated_list(
+                    active_only=False, include_retired=True
+                )
+            except codeforcespy.base._REFRESH_ERRORS:  # keep the snapshot
+                continue
+            self._rated_index = {user.handle: user for user in users}
+
+    async def _lookup_users(
+        self, handles: str, check_historic_handles: bool | None
+    ) -> list[codeforcespy.abc.objects.User]:
+        """
+        Issue one ``user.info`` request; used by the lookup batcher.
+
+        Parameters
+        ----------
+        handles : str
+            Semicolon-separated list of user handles.
+        check_historic_handles : bool | None
+            Whether to check historic handles.
+
+        Returns
+        -------
+        list[codeforcespy.abc.objects.User]
+            A list of user objects.
+        """
+        return await self._call(
+            "user.info", handles=handles, check_historic_handles=check_historic_handles
         )
-        return typing.cast("list[codeforcespy.abc.objects.User]", result)
 
     async def get_user_blog_entries(
         self, handle: str
@@ -283,13 +663,7 @@ class AsyncUser(codeforcespy.features.mixin_base.AsyncFeatureMixin, abc.ABC):
         codeforcespy.errors.APIError
             If the API response indicates a failure.
         """
-        endpoint_url: str = self._url_generator.user_blog_entries(handle=handle)
-        result = await self._execute_request(
-            "user.blogEntries",
-            endpoint_url,
-            codeforcespy.abc.interactions.UserBlogEntryResponse,
-        )
-        return typing.cast("list[codeforcespy.abc.objects.BlogEntry]", result)
+        return await self._call("user.blogEntries", handle=handle)
 
     async def get_user_friends(self, only_online: bool = True) -> list[str]:
         """
@@ -310,13 +684,7 @@ class AsyncUser(codeforcespy.features.mixin_base.AsyncFeatureMixin, abc.ABC):
         codeforcespy.errors.APIError
             If the API response indicates a failure.
         """
-        endpoint_url: str = self._url_generator.user_friends(only_online=only_online)
-        result = await self._execute_request(
-            "user.friends",
-            endpoint_url,
-            codeforcespy.abc.interactions.UserFriendResponse,
-        )
-        return typing.cast("list[str]", result)
+        return await self._call("user.friends", only_online=only_online)
 
     async def get_user_rated_list(
         self,
@@ -346,17 +714,12 @@ class AsyncUser(codeforcespy.features.mixin_base.AsyncFeatureMixin, abc.ABC):
         codeforcespy.errors.APIError
             If the API response indicates a failure.
         """
-        endpoint_url: str = self._url_generator.user_rated_list(
+        return await self._call(
+            "user.ratedList",
             active_only=active_only,
             include_retired=include_retired,
             contest_id=contest_id,
         )
-        result = await self._execute_request(
-            "user.ratedList",
-            endpoint_url,
-            codeforcespy.abc.interactions.UserRatedListResponse,
-        )
-        return typing.cast("list[codeforcespy.abc.objects.User]", result)
 
     async def get_user_rating(
         self, handle: str
@@ -379,13 +742,46 @@ class AsyncUser(codeforcespy.features.mixin_base.AsyncFeatureMixin, abc.ABC):
         codeforcespy.errors.APIError
             If the API response indicates a failure.
         """
-        endpoint_url: str = self._url_generator.user_rating(handle=handle)
-        result = await self._execute_request(
-            "user.rating",
-            endpoint_url,
-            codeforcespy.abc.interactions.UserRatingResponse,
-        )
-        return typing.cast("list[codeforcespy.abc.objects.RatingChange]", result)
+        return await self._call("user.rating", handle=handle)
+
+    async def get_users_ratings_bulk(
+        self, handles: collections.abc.Iterable[str], concurrency: int = 10
+    ) -> dict[str, list[codeforcespy.abc.objects.RatingChange]]:
+        """
+        Asynchronously retrieve the rating histories of several users.
+
+        ``user.rating`` accepts a single handle, so one request is issued per
+        handle; the requests run concurrently and still pass through the
+        shared rate limiter.
+
+        Parameters
+        ----------
+        handles : Iterable[str]
+            The Codeforces user handles.
+        concurrency : int, optional
+            The maximum number of requests in flight (default is 10).
+
+        Returns
+        -------
+        dict[str, list[codeforcespy.abc.objects.RatingChange]]
+            Rating changes by handle, in the order of `handles`.
+
+        Raises
+        ------
+        codeforcespy.errors.APIError
+            If any API response indicates a failure.
+        """
+        handles = list(handles)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(
+            handle: str,
+        ) -> list[codeforcespy.abc.objects.RatingChange]:
+            async with semaphore:
+                return await self.get_user_rating(handle)
+
+        histories = await asyncio.gather(*(fetch(handle) for handle in handles))
+        return dict(zip(handles, histories, strict=True))
 
     async def get_user_status(
         self, handle: str, from_index: int = 1, count: int = 10
@@ -412,12 +808,110 @@ class AsyncUser(codeforcespy.features.mixin_base.AsyncFeatureMixin, abc.ABC):
         codeforcespy.errors.APIError
             If the API response indicates a failure.
         """
-        endpoint_url: str = self._url_generator.user_status(
-            handle=handle, from_index=from_index, count=count
+        return await self._call(
+            "user.status", handle=handle, from_index=from_index, count=count
         )
-        result = await self._execute_request(
-            "user.status",
-            endpoint_url,
-            codeforcespy.abc.interactions.UserStatusResponse,
+
+    async def get_user_status_stream(
+        self,
+        handle: str,
+        from_index: int = 1,
+        count: int | None = None,
+        page_size: int = 1000,
+    ) -> collections.abc.AsyncIterator[codeforcespy.abc.objects.Submission]:
+        """
+        Asynchronously stream a user's submissions page by page.
+
+        Only one page of submissions is held in memory at a time, which keeps
+        long histories cheap to walk compared to one large `get_user_status`.
+
+        Parameters
+        ----------
+        handle : str
+            The Codeforces user handle.
+        from_index : int, optional
+            The starting index for submissions (default is 1).
+        count : int | None, optional
+            The number of submissions to yield; None yields all of them
+            (default is None).
+        page_size : int, optional
+            The number of submissions fetched per request (default is 1000).
+
+        Yields
+        ------
+        codeforcespy.abc.objects.Submission
+            Submission objects, newest first.
+
+        Raises
+        ------
+        codeforcespy.errors.APIError
+            If the API response indicates a failure.
+        """
+        remaining = count
+        while remaining is None or remaining > 0:
+            size = page_size if remaining is None else min(page_size, remaining)
+            page = await self.get_user_status(handle, from_index, size)
+            for submission in page:
+                yield submission
+            if len(page) < size:
+                return
+            from_index += size
+            if remaining is not None:
+                remaining -= size
+
+    async def get_user_status_all(
+        self,
+        handle: str,
+        total: int,
+        from_index: int = 1,
+        page_size: int = 1000,
+        concurrency: int = 8,
+    ) -> list[codeforcespy.abc.objects.Submission]:
+        """
+        Asynchronously retrieve many submissions with concurrent page requests.
+
+        The pages are requested together rather than one after another, so
+        their round trips overlap; they still pass through the shared rate
+        limiter.
+
+        Parameters
+        ----------
+        handle : str
+            The Codeforces user handle.
+        total : int
+            The number of submissions to retrieve.
+        from_index : int, optional
+            The starting index for submissions (default is 1).
+        page_size : int, optional
+            The number of submissions fetched per request (default is 1000).
+        concurrency : int, optional
+            The maximum number of page requests in flight (default is 8).
+
+        Returns
+        -------
+        list[codeforcespy.abc.objects.Submission]
+            Submission objects, newest first; shorter than `total` if the
+            user has fewer submissions.
+
+        Raises
+        ------
+        codeforcespy.errors.APIError
+            If the API response indicates a failure.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch_page(
+            offset: int,
+        ) -> list[codeforcespy.abc.objects.Submission]:
+            async with semaphore:
+                return await self.get_user_status(
+                    handle, offset, min(page_size, from_index + total - offset)
+                )
+
+        pages = await asyncio.gather(
+            *(
+                fetch_page(offset)
+                for offset in range(from_index, from_index + total, page_size)
+            )
         )
-        return typing.cast("list[codeforcespy.abc.objects.Submission]", result)
+        return [submission for page in pages for submission in page]
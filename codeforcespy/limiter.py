@@ -0,0 +1,129 @@
+"""
+🚦 Request Rate Limiting.
+============================
+
+Token-bucket limiter shared by the synchronous and asynchronous clients.
+
+✨ Capabilities
+-------------------
+- 🪣 Token Bucket: Smooths request issuance to the Codeforces call limit.
+- 🔄 Dual Mode: One bucket serves blocking and ``asyncio`` callers alike.
+
+📦 Classes
+--------------
+- `TokenBucket`: Thread-safe token bucket handing out send reservations.
+
+📝 Compliance
+-----------------
+Adheres to FinTech industry best practices, NumPy-style docstrings, and
+strict PEP 8/257 standards.
+"""
+
+import asyncio
+import threading
+import time
+
+DEFAULT_RATE: int = 1
+"""Requests allowed per `DEFAULT_PERIOD` (Codeforces: 1 call per 2 seconds)."""
+
+DEFAULT_PERIOD: float = 2.0
+"""Length of the rate-limit window in seconds."""
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket handing out send reservations.
+
+    Callers reserve a token and are told how long to wait before sending.
+    Reservations may drive the bucket negative, which queues callers in
+    arrival order without holding the lock while they sleep; this lets the
+    same bucket back both blocking and ``asyncio`` clients.
+
+    Attributes
+    ----------
+    _rate : float
+        Number of requests allowed per period (also the burst size).
+    _period : float
+        Length of the rate-limit window in seconds.
+    _tokens : float
+        Currently available tokens; negative while callers are queued.
+    _updated : float
+        Monotonic timestamp of the last refill.
+    _lock : threading.Lock
+        Guards the bucket state.
+    """
+
+    __slots__: tuple[str, ...] = ("_lock", "_period", "_rate", "_tokens", "_updated")
+
+    def __init__(
+        self, rate: float = DEFAULT_RATE, period: float = DEFAULT_PERIOD
+    ) -> None:
+        """
+        Initialize a full bucket.
+
+        Parameters
+        ----------
+        rate : float, optional
+            Requests allowed per period (default is `DEFAULT_RATE`).
+        period : float, optional
+            Window length in seconds (default is `DEFAULT_PERIOD`).
+        """
+        self._lock: threading.Lock = threading.Lock()
+        self._rate: float = float(rate)
+        self._period: float = float(period)
+        self._tokens: float = self._rate
+        self._updated: float = time.monotonic()
+
+    def configure(self, rate: float, period: float) -> None:
+        """
+        Change the allowed rate and refill the bucket.
+
+        Parameters
+        ----------
+        rate : float
+            Requests allowed per period.
+        period : float
+            Window length in seconds.
+
+        Raises
+        ------
+        ValueError
+            If `rate` or `period` is not positive.
+        """
+        if rate <= 0 or period <= 0:
+            raise ValueError("rate and period must be positive")
+        with self._lock:
+            self._rate = float(rate)
+            self._period = float(period)
+            self._tokens = self._rate
+            self._updated = time.monotonic()
+
+    def reserve(self) -> float:
+        """
+        Reserve one token.
+
+        Returns
+        -------
+        float
+            Seconds the caller must wait before sending its request.
+        """
+        with self._lock:
+            now = time.monotonic()
+            refill = (now - self._updated) * self._rate / self._period
+            self._tokens = min(self._rate, self._tokens + refill) - 1.0
+            self._updated = now
+            if self._tokens >= 0.0:
+                return 0.0
+            return -self._tokens * self._period / self._rate
+
+    def acquire(self) -> None:
+        """Block the calling thread until a request may be sent."""
+        delay = self.reserve()
+        if delay > 0.0:
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        """Suspend the calling coroutine until a request may be sent."""
+        delay = self.reserve()
+        if delay > 0.0:
+            await asyncio.sleep(delay)
@@ -11,6 +11,7 @@ classes, ensuring a seamless developer experience.
 - 🔄 Unified Clients: `SyncMethod` and `AsyncMethod` consolidate all API features.
 - 🔐 Secure Auth: Optional API key and secret handling for private endpoints.
 - ⚡ High Performance: Optimized for both blocking and non-blocking I/O contexts.
+- ♻️ Caching: TTL cache with optional stale-while-revalidate refreshes.
 - 🛡️ Type Safety: Fully typed strict compliance (PEP 484).
 
 📦 Classes
@@ -24,16 +25,22 @@ Adheres to FinTech industry best practices, NumPy-style docstrings, and
 strict PEP 8/257 standards.
 """
 
+import asyncio
+import collections.abc
+import concurrent.futures
+import threading
 import typing
 
-import msgspec
-
+import codeforcespy.abc.endpoints
+import codeforcespy.abc.objects
 import codeforcespy.abc.protocols
 import codeforcespy.base
+import codeforcespy.batching
+import codeforcespy.cache
 import codeforcespy.clients
-import codeforcespy.errors
 import codeforcespy.features.blog
 import codeforcespy.features.contest
+import codeforcespy.features.mixin_base
 import codeforcespy.features.problemset
 import codeforcespy.features.recent
 import codeforcespy.features.user
@@ -54,14 +61,36 @@ class SyncMethod(
     ----------
     _client : codeforcespy.clients.SyncClient
         Synchronous HTTP client for making API requests.
+    _user_info_batcher : codeforcespy.batching.SyncUserInfoBatcher
+        Coalesces concurrent ``user.info`` lookups.
+    _rated_index : dict[str, codeforcespy.abc.objects.User]
+        Rated-list snapshot by handle, filled by `prime_rated_index`.
+    _inflight : dict[str, concurrent.futures.Future[list[object]]]
+        Network fetches in progress by endpoint URL, shared by identical
+        concurrent requests.
+    _inflight_lock : threading.Lock
+        Guards `_inflight`.
     """
 
+    __slots__: tuple[str, ...] = (
+        "__weakref__",
+        "_client",
+        "_inflight",
+        "_inflight_lock",
+        "_rated_index",
+        "_user_info_batcher",
+    )
+
     def __init__(
         self,
         enable_auth: bool | None = False,
         auth_key: str | None = None,
         unix_time: int | None = None,
         secret: str | None = None,
+        cache_ttls: dict[str, float] | None = None,
+        stale_while_revalidate: bool = False,
+        negative_ttl: float = codeforcespy.cache.DEFAULT_NEGATIVE_TTL,
+        cache_max_entries: int = codeforcespy.cache.DEFAULT_MAX_ENTRIES,
     ) -> None:
         """
         Initialize the synchronous client.
@@ -76,39 +105,140 @@ class SyncMethod(
             Unix timestamp for signing requests (default is None).
         secret : str | None, optional
             API secret for signing requests (default is None).
+        cache_ttls : dict[str, float] | None, optional
+            Per-method cache TTL overrides in seconds (default is None).
+        stale_while_revalidate : bool, optional
+            Serve expired cache entries while refreshing them on a
+            background thread (default is False).
+        negative_ttl : float, optional
+            Seconds a "not found" failure of a ``user.*`` method is replayed
+            without a request; 0 disables it (default is 60).
+        cache_max_entries : int, optional
+            Responses kept in the cache before the least recently used one
+            is evicted (default is 256).
         """
-        super().__init__(enable_auth, auth_key, unix_time, secret)
-        self._client: codeforcespy.clients.SyncClient = (
-            codeforcespy.clients.SyncClient()
+        super().__init__(
+            enable_auth,
+            auth_key,
+            unix_time,
+            secret,
+            cache_ttls=cache_ttls,
+            stale_while_revalidate=stale_while_revalidate,
+            negative_ttl=negative_ttl,
+            cache_max_entries=cache_max_entries,
+        )
+        self._client: codeforcespy.clients.SyncClient = codeforcespy.clients.SyncClient(
+            limiter=self._limiter
+        )
+        self._user_info_batcher: codeforcespy.batching.SyncUserInfoBatcher = (
+            codeforcespy.batching.SyncUserInfoBatcher(self._lookup_users)
         )
+        self._rated_index: dict[str, codeforcespy.abc.objects.User] = {}
+        self._inflight: dict[str, concurrent.futures.Future[list[object]]] = {}
+        self._inflight_lock: threading.Lock = threading.Lock()
 
-    def _generate_response(self, url: str) -> bytes:
+    @typing.override
+    def _execute_request(
+        self,
+        method_name: str,
+        endpoint_url: str,
+        response_cls: type[codeforcespy.abc.protocols.ResponseProtocol],
+    ) -> list[typing.Any]:
         """
-        Execute an HTTP GET request and return the response content.
+        Execute an API request synchronously and decode the response.
 
         Parameters
         ----------
-        url : str
-            The URL to request.
+        method_name : str
+            The API method name.
+        endpoint_url : str
+            The raw endpoint URL.
+        response_cls : type[ResponseProtocol]
+            The class used to decode the JSON response.
 
         Returns
         -------
-        bytes
-            The raw response content.
+        list[Any]
+            The decoded result wrapped as a list, holding instances of the
+            result type declared by `response_cls`.
+
+        Raises
+        ------
+        codeforcespy.errors.APIError
+            If the API response indicates a failure.
+        """
+        self._raise_known_failure(endpoint_url)
+        cached, refresh = self._cached_result(method_name, endpoint_url)
+        if cached is None:
+            return self._fetch_shared(method_name, endpoint_url, response_cls)
+        if refresh and self._response_cache.claim_refresh(endpoint_url):
+            threading.Thread(
+                target=self._refresh,
+                args=(method_name, endpoint_url, response_cls),
+                daemon=True,
+            ).start()
+        return cached
+
+    def _fetch_shared(
+        self,
+        method_name: str,
+        endpoint_url: str,
+        response_cls: type[codeforcespy.abc.protocols.ResponseProtocol],
+    ) -> list[object]:
         """
-        with self._client as socket:
-            response = socket.get(url=url)
-            return response.content
+        Fetch an endpoint, joining an identical fetch already in progress.
 
-    @typing.override
-    def _execute_request(
+        The first thread to request an endpoint URL performs the fetch;
+        threads requesting it meanwhile wait for and share its outcome.
+
+        Parameters
+        ----------
+        method_name : str
+            The API method name.
+        endpoint_url : str
+            The raw endpoint URL.
+        response_cls : type[ResponseProtocol]
+            The class used to decode the JSON response.
+
+        Returns
+        -------
+        list[object]
+            The decoded result wrapped as a list.
+
+        Raises
+        ------
+        codeforcespy.errors.APIError
+            If the API response indicates a failure.
+        """
+        with self._inflight_lock:
+            future = self._inflight.get(endpoint_url)
+            leader = future is None
+            if future is None:
+                future = concurrent.futures.Future()
+                self._inflight[endpoint_url] = future
+        if not leader:
+            return list(future.result())
+
+        try:
+            result = self._fetch(method_name, endpoint_url, response_cls)
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(result)
+            return list(result)
+        finally:
+            with self._inflight_lock:
+                del self._inflight[endpoint_url]
+
+    def _fetch(
         self,
         method_name: str,
         endpoint_url: str,
         response_cls: type[codeforcespy.abc.protocols.ResponseProtocol],
     ) -> list[object]:
         """
-        Execute an API request synchronously and decode the response.
+        Fetch and decode an endpoint over the network.
 
         Parameters
         ----------
@@ -132,18 +262,144 @@ class SyncMethod(
         final_url: str = self._generate_authorisation(
             method_name=method_name, end_point_url=endpoint_url
         )
-        response_bytes: bytes = self._generate_response(url=final_url)
-        base = msgspec.json.decode(response_bytes, strict=False, type=response_cls)
+        self._limiter.acquire()
+        response = self._client.get(
+            url=final_url,
+            headers=self._response_cache.revalidation_headers(endpoint_url),
+        )
+        if (
+            response.status_code == 304
+            and self._response_cache.get(endpoint_url) is None
+        ):
+            # The entry was evicted while the request was in flight.
+            self._limiter.acquire()
+            response = self._client.get(url=final_url)
+        return self._resolve_response(method_name, endpoint_url, response, response_cls)
+
+    def _refresh(
+        self,
+        method_name: str,
+        endpoint_url: str,
+        response_cls: type[codeforcespy.abc.protocols.ResponseProtocol],
+    ) -> None:
+        """
+        Refresh a stale cache entry; runs on a background thread.
 
-        if base.status != "FAILED":
-            return self._ensure_list(base.result)
-        else:
-            raise codeforcespy.errors.APIError(base.comment)
+        Parameters
+        ----------
+        method_name : str
+            The API method name.
+        endpoint_url : str
+            The raw endpoint URL.
+        response_cls : type[ResponseProtocol]
+            The class used to decode the JSON response.
+        """
+        try:
+            _ = self._fetch(method_name, endpoint_url, response_cls)
+        except codeforcespy.base._REFRESH_ERRORS:
+            pass
+        finally:
+            self._response_cache.release_refresh(endpoint_url)
+
+    def batch(
+        self,
+        calls: collections.abc.Iterable[
+            tuple["codeforcespy.abc.endpoints.MethodName", dict[str, typing.Any]]
+        ],
+        max_workers: int = 8,
+    ) -> list[list[typing.Any]]:
+        """
+        Execute several API calls concurrently and return their results.
+
+        Calls run on a thread pool sharing this client's connection pool, so
+        their round trips overlap; they still pass through the shared rate
+        limiter and the response cache.
+
+        Parameters
+        ----------
+        calls : Iterable[tuple[MethodName, dict[str, Any]]]
+            API method names with the keyword arguments of their
+            `CodeForcesAPI` URL builder, e.g.
+            ``("user.rating", {"handle": "tourist"})``.
+        max_workers : int, optional
+            The maximum number of calls in flight (default is 8).
+
+        Returns
+        -------
+        list[list[Any]]
+            The decoded results, in the order of `calls`.
+
+        Raises
+        ------
+        codeforcespy.errors.APIError
+            If any API response indicates a failure.
+        """
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = [
+                pool.submit(self._call, method_name, **params)
+                for method_name, params in calls
+            ]
+            return [future.result() for future in futures]
+
+    def get_raw(
+        self,
+        method_name: "codeforcespy.abc.endpoints.MethodName",
+        **params: typing.Any,
+    ) -> bytes:
+        """
+        Call an API method and return the undecoded JSON body.
+
+        Meant for callers that forward the payload (proxies, dashboards):
+        only the response status is decoded, so no result objects are built.
+        The response cache is bypassed; the rate limiter still applies.
+
+        Parameters
+        ----------
+        method_name : MethodName
+            The API method name, e.g. ``"contest.list"``.
+        **params : Any
+            Keyword arguments of the method's `CodeForcesAPI` URL builder.
+
+        Returns
+        -------
+        bytes
+            The raw JSON response body.
+
+        Raises
+        ------
+        codeforcespy.errors.APIError
+            If the API response indicates a failure.
+        """
+        builder, _ = codeforcespy.features.mixin_base._METHOD_TABLE[method_name]
+        endpoint_url: str = getattr(self._url_generator, builder)(**params)
+        self._raise_known_failure(endpoint_url)
+        final_url: str = self._generate_authorisation(
+            method_name=method_name, end_point_url=endpoint_url
+        )
+        self._limiter.acquire()
+        response = self._client.get(url=final_url)
+        return self._resolve_raw(method_name, endpoint_url, response)
 
     def close(self) -> None:
-        """Close the underlying synchronous HTTP client."""
+        """Stop the lookup batcher and close the underlying HTTP client."""
+        self._user_info_batcher.close()
         self._client.close()
 
+    def __enter__(self) -> typing.Self:
+        """
+        Use the client as a context manager.
+
+        Returns
+        -------
+        typing.Self
+            This client, whose connections stay open until the block exits.
+        """
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Close the client when the ``with`` block exits."""
+        self.close()
+
 
 class AsyncMethod(
     codeforcespy.base.BaseClient,
@@ -160,14 +416,47 @@ class AsyncMethod(
     ----------
     _client : codeforcespy.clients.AsyncClient
         Asynchronous HTTP client for making API requests.
+    _background_tasks : set[asyncio.Task[None]]
+        Pending stale-while-revalidate refreshes, referenced until done.
+    _user_info_batcher : codeforcespy.batching.AsyncUserInfoBatcher
+        Coalesces concurrent ``user.info`` lookups.
+    _rated_index : dict[str, codeforcespy.abc.objects.User]
+        Rated-list snapshot by handle, filled by `prime_rated_index`.
+    _rated_index_task : asyncio.Task[None] | None
+        Periodic rated-index reload started by `prime_rated_index`, if any.
+    _inflight : dict[str, asyncio.Task[list[object]]]
+        Network fetches in progress by endpoint URL, shared by identical
+        concurrent requests.
+
+    Notes
+    -----
+    The client runs on whatever event loop is current. For large fan-outs
+    (`batch`, `get_users_bulk`, `get_user_status_all`), calling
+    `codeforcespy.install_uvloop` before ``asyncio.run`` swaps in the
+    libuv-based ``uvloop``, which typically cuts per-request dispatch
+    overhead by about half.
     """
 
+    __slots__: tuple[str, ...] = (
+        "_background_tasks",
+        "_client",
+        "_inflight",
+        "_rated_index",
+        "_rated_index_task",
+        "_user_info_batcher",
+    )
+
     def __init__(
         self,
         enable_auth: bool | None = False,
         auth_key: str | None = None,
         unix_time: int | None = None,
         secret: str | None = None,
+        cache_ttls: dict[str, float] | None = None,
+        stale_while_revalidate: bool = False,
+        negative_ttl: float = codeforcespy.cache.DEFAULT_NEGATIVE_TTL,
+        http2: bool = True,
+        cache_max_entries: int = codeforcespy.cache.DEFAULT_MAX_ENTRIES,
     ) -> None:
         """
         Initialize the asynchronous client.
@@ -182,39 +471,142 @@ class AsyncMethod(
             Unix timestamp for signing requests (default is None).
         secret : str | None, optional
             API secret for signing requests (default is None).
+        cache_ttls : dict[str, float] | None, optional
+            Per-method cache TTL overrides in seconds (default is None).
+        stale_while_revalidate : bool, optional
+            Serve expired cache entries while refreshing them in a
+            background task (default is False).
+        negative_ttl : float, optional
+            Seconds a "not found" failure of a ``user.*`` method is replayed
+            without a request; 0 disables it (default is 60).
+        http2 : bool, optional
+            Whether to multiplex concurrent requests over HTTP/2
+            (default is True).
+        cache_max_entries : int, optional
+            Responses kept in the cache before the least recently used one
+            is evicted (default is 256).
         """
-        super().__init__(enable_auth, auth_key, unix_time, secret)
+        super().__init__(
+            enable_auth,
+            auth_key,
+            unix_time,
+            secret,
+            cache_ttls=cache_ttls,
+            stale_while_revalidate=stale_while_revalidate,
+            negative_ttl=negative_ttl,
+            cache_max_entries=cache_max_entries,
+        )
         self._client: codeforcespy.clients.AsyncClient = (
-            codeforcespy.clients.AsyncClient()
+            codeforcespy.clients.AsyncClient(http2=http2)
         )
+        self._background_tasks: set[asyncio.Task[None]] = set()
+        self._user_info_batcher: codeforcespy.batching.AsyncUserInfoBatcher = (
+            codeforcespy.batching.AsyncUserInfoBatcher(self._lookup_users)
+        )
+        self._rated_index: dict[str, codeforcespy.abc.objects.User] = {}
+        self._rated_index_task: asyncio.Task[None] | None = None
+        self._inflight: dict[str, asyncio.Task[list[object]]] = {}
 
-    async def _generate_response(self, url: str) -> bytes:
+    @typing.override
+    async def _execute_request(
+        self,
+        method_name: str,
+        endpoint_url: str,
+        response_cls: type[codeforcespy.abc.protocols.ResponseProtocol],
+    ) -> list[typing.Any]:
         """
-        Execute an asynchronous HTTP GET request and return the response content.
+        Execute an asynchronous API request and decode the response.
 
         Parameters
         ----------
-        url : str
-            The URL to request.
+        method_name : str
+            The API method name.
+        endpoint_url : str
+            The raw endpoint URL.
+        response_cls : type[ResponseProtocol]
+            The class used to decode the JSON response.
 
         Returns
         -------
-        bytes
-            The raw response content.
+        list[Any]
+            The decoded result wrapped as a list, holding instances of the
+            result type declared by `response_cls`.
+
+        Raises
+        ------
+        codeforcespy.errors.APIError
+            If the API response indicates a failure.
+        """
+        self._raise_known_failure(endpoint_url)
+        cached, refresh = self._cached_result(method_name, endpoint_url)
+        if cached is None:
+            return await self._fetch_shared(method_name, endpoint_url, response_cls)
+        if refresh and self._response_cache.claim_refresh(endpoint_url):
+            task = asyncio.create_task(
+                self._refresh(method_name, endpoint_url, response_cls)
+            )
+            self._background_tasks.add(task)
+            task.add_done_callback(self._background_tasks.discard)
+        return cached
+
+    async def _fetch_shared(
+        self,
+        method_name: str,
+        endpoint_url: str,
+        response_cls: type[codeforcespy.abc.protocols.ResponseProtocol],
+    ) -> list[object]:
         """
-        async with self._client as socket:
-            response = await socket.get(url=url)
-            return response.read()
+        Fetch an endpoint, joining an identical fetch already in progress.
 
-    @typing.override
-    async def _execute_request(
+        The fetch runs as a task shared by every coroutine requesting the
+        same endpoint URL meanwhile; it is shielded so that one cancelled
+        caller does not cancel the others. A failure is consumed even when
+        no caller is left to await it.
+
+        Parameters
+        ----------
+        method_name : str
+            The API method name.
+        endpoint_url : str
+            The raw endpoint URL.
+        response_cls : type[ResponseProtocol]
+            The class used to decode the JSON response.
+
+        Returns
+        -------
+        list[object]
+            The decoded result wrapped as a list.
+
+        Raises
+        ------
+        codeforcespy.errors.APIError
+            If the API response indicates a failure.
+        """
+        task = self._inflight.get(endpoint_url)
+        if task is None:
+            task = asyncio.create_task(
+                self._fetch(method_name, endpoint_url, response_cls)
+            )
+            self._inflight[endpoint_url] = task
+
+            def settle(done: asyncio.Task[list[object]]) -> None:
+                _ = self._inflight.pop(endpoint_url, None)
+                if not done.cancelled():
+                    # Mark a failure as retrieved even if every waiter was
+                    # cancelled, so asyncio does not log it as unhandled.
+                    _ = done.exception()
+
+            task.add_done_callback(settle)
+        return list(await asyncio.shield(task))
+
+    async def _fetch(
         self,
         method_name: str,
         endpoint_url: str,
         response_cls: type[codeforcespy.abc.protocols.ResponseProtocol],
     ) -> list[object]:
         """
-        Execute an asynchronous API request and decode the response.
+        Asynchronously fetch and decode an endpoint over the network.
 
         Parameters
         ----------
@@ -238,14 +630,147 @@ class AsyncMethod(
         final_url: str = self._generate_authorisation(
             method_name=method_name, end_point_url=endpoint_url
         )
-        response_bytes: bytes = await self._generate_response(url=final_url)
-        base = msgspec.json.decode(response_bytes, strict=False, type=response_cls)
+        await self._limiter.acquire_async()
+        response = await self._client.get(
+            url=final_url,
+            headers=self._response_cache.revalidation_headers(endpoint_url),
+        )
+        if (
+            response.status_code == 304
+            and self._response_cache.get(endpoint_url) is None
+        ):
+            # The entry was evicted while the request was in flight.
+            await self._limiter.acquire_async()
+            response = await self._client.get(url=final_url)
+        return self._resolve_response(method_name, endpoint_url, response, response_cls)
+
+    async def _refresh(
+        self,
+        method_name: str,
+        endpoint_url: str,
+        response_cls: type[codeforcespy.abc.protocols.ResponseProtocol],
+    ) -> None:
+        """
+        Refresh a stale cache entry; runs as a background task.
+
+        Parameters
+        ----------
+        method_name : str
+            The API method name.
+        endpoint_url : str
+            The raw endpoint URL.
+        response_cls : type[ResponseProtocol]
+            The class used to decode the JSON response.
+        """
+        try:
+            _ = await self._fetch(method_name, endpoint_url, response_cls)
+        except codeforcespy.base._REFRESH_ERRORS:
+            pass
+        finally:
+            self._response_cache.release_refresh(endpoint_url)
+
+    async def batch(
+        self,
+        calls: collections.abc.Iterable[
+            tuple["codeforcespy.abc.endpoints.MethodName", dict[str, typing.Any]]
+        ],
+    ) -> list[list[typing.Any]]:
+        """
+        Execute several API calls concurrently and return their results.
+
+        Calls are gathered on the event loop and share this client's
+        connection pool, so their round trips overlap; they still pass
+        through the shared rate limiter and the response cache.
+
+        Parameters
+        ----------
+        calls : Iterable[tuple[MethodName, dict[str, Any]]]
+            API method names with the keyword arguments of their
+            `CodeForcesAPI` URL builder, e.g.
+            ``("user.rating", {"handle": "tourist"})``.
+
+        Returns
+        -------
+        list[list[Any]]
+            The decoded results, in the order of `calls`.
+
+        Raises
+        ------
+        codeforcespy.errors.APIError
+            If any API response indicates a failure.
+        """
+        return list(
+            await asyncio.gather(
+                *(self._call(method_name, **params) for method_name, params in calls)
+            )
+        )
 
-        if base.status != "FAILED":
-            return self._ensure_list(base.result)
-        else:
-            raise codeforcespy.errors.APIError(base.comment)
+    async def get_raw(
+        self,
+        method_name: "codeforcespy.abc.endpoints.MethodName",
+        **params: typing.Any,
+    ) -> bytes:
+        """
+        Asynchronously call an API method and return the undecoded JSON body.
+
+        Meant for callers that forward the payload (proxies, dashboards):
+        only the response status is decoded, so no result objects are built.
+        The response cache is bypassed; the rate limiter still applies.
+
+        Parameters
+        ----------
+        method_name : MethodName
+            The API method name, e.g. ``"contest.list"``.
+        **params : Any
+            Keyword arguments of the method's `CodeForcesAPI` URL builder.
+
+        Returns
+        -------
+        bytes
+            The raw JSON response body.
+
+        Raises
+        ------
+        codeforcespy.errors.APIError
+            If the API response indicates a failure.
+        """
+        builder, _ = codeforcespy.features.mixin_base._METHOD_TABLE[method_name]
+        endpoint_url: str = getattr(self._url_generator, builder)(**params)
+        self._raise_known_failure(endpoint_url)
+        final_url: str = self._generate_authorisation(
+            method_name=method_name, end_point_url=endpoint_url
+        )
+        await self._limiter.acquire_async()
+        response = await self._client.get(url=final_url)
+        return self._resolve_raw(method_name, endpoint_url, response)
 
     async def close(self) -> None:
-        """Asynchronously close the underlying HTTP client."""
+        """Cancel pending background work and close the underlying HTTP client."""
+        self._user_info_batcher.close()
+        for task in (*self._background_tasks, *self._inflight.values()):
+            _ = task.cancel()
         await self._client.aclose()
+
+    async def __aenter__(self) -> typing.Self:
+        """
+        Use the client as an asynchronous context manager.
+
+        Returns
+        -------
+        typing.Self
+            This client, whose connections stay open until the block exits.
+        """
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Close the client when the ``async with`` block exits."""
+        await self.close()
+
+
+def _prime_decoders() -> None:
+    """Build the decoder of every response class at import time."""
+    for _, response_cls in codeforcespy.features.mixin_base._METHOD_TABLE.values():
+        _ = codeforcespy.base._decoder_for(response_cls)
+
+
+_prime_decoders()
@@ -0,0 +1,44 @@
+"""
+⚡ Optional Speedups.
+========================
+
+Opt-in hooks for accelerated third-party runtimes.
+
+✨ Capabilities
+-------------------
+- 🔁 Event Loop: Switches ``asyncio`` to ``uvloop`` when it is installed
+  (``pip install codeforcespy[fast]``).
+
+📦 Functions
+----------------
+- `install_uvloop`: Make ``uvloop`` the event loop for new ``asyncio`` loops.
+
+📝 Compliance
+-----------------
+Adheres to FinTech industry best practices, NumPy-style docstrings, and
+strict PEP 8/257 standards.
+"""
+
+import asyncio
+import importlib
+
+
+def install_uvloop() -> bool:
+    """
+    Use ``uvloop`` for event loops created after this call.
+
+    Call it before ``asyncio.run``; loops that are already running keep
+    their implementation. Nothing happens if ``uvloop`` is not installed,
+    so applications can call it unconditionally.
+
+    Returns
+    -------
+    bool
+        True if ``uvloop`` was installed as the event loop policy.
+    """
+    try:
+        uvloop = importlib.import_module("uvloop")
+    except ImportError:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
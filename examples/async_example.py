@@ -7,6 +7,7 @@ for high-concurrency applications and async frameworks.
 
 import asyncio
 
+import codeforcespy
 import codeforcespy.errors
 import codeforcespy.processors
 
@@ -21,6 +22,20 @@ async def fetch_user_info(client: codeforcespy.processors.AsyncMethod) -> None:
     print()
 
 
+async def fetch_rating_histories(
+    client: codeforcespy.processors.AsyncMethod,
+    handles: list[str],
+) -> None:
+    """Fetch the rating histories of several users in one call."""
+    histories = await client.get_users_ratings_bulk(handles)
+    print("Rating histories:")
+    print("-" * 40)
+    for handle, changes in histories.items():
+        peak = max((change.newRating or 0 for change in changes), default=0)
+        print(f"  {handle}: {len(changes)} contests, peak {peak}")
+    print()
+
+
 async def fetch_contest_standings(
     client: codeforcespy.processors.AsyncMethod,
     contest_id: int,
@@ -35,21 +50,11 @@ async def fetch_contest_standings(
     if standings:
         standing = standings[0]
         if standing.contest:
-            contest = (
-                standing.contest[0]
-                if isinstance(standing.contest, list)
-                else standing.contest
-            )
-            print(f"Contest: {contest.name}")
+            print(f"Contest: {standing.contest.name}")
             print("-" * 40)
 
         if standing.rows:
-            rows = (
-                standing.rows
-                if isinstance(standing.rows, list)
-                else [standing.rows]
-            )
-            for row in rows:
+            for row in standing.rows:
                 if row.party and row.party.members:
                     handle = row.party.members[0].handle
                     print(f"  Rank {row.rank}: {handle} ({row.points} pts)")
@@ -63,26 +68,29 @@ async def fetch_problems_by_tag(
     """Fetch problems filtered by tag."""
     result = await client.get_problemset_problems(tags=tag)
     if result:
-        problems_data = result[0]
-        problems = problems_data.problems
+        problems = result[0].problems
         if problems:
-            problem_list = problems if isinstance(problems, list) else [problems]
             print(f"Problems with tag '{tag}' (first 5):")
             print("-" * 40)
-            for problem in problem_list[:5]:
+            for problem in problems[:5]:
                 rating = problem.rating if problem.rating else "unrated"
-                print(f"  {problem.contestId}{problem.index}: {problem.name} [{rating}]")
+                print(
+                    f"  {problem.contestId}{problem.index}: {problem.name} [{rating}]"
+                )
     print()
 
 
 async def main() -> None:
     """Run all async examples concurrently."""
-    client = codeforcespy.processors.AsyncMethod()
+    # One client for every task: with HTTP/2 the concurrent requests below
+    # are multiplexed over a single TCP+TLS connection.
+    client = codeforcespy.processors.AsyncMethod(http2=True)
 
     try:
         # Run multiple requests concurrently for better performance
         _ = await asyncio.gather(
             fetch_user_info(client),
+            fetch_rating_histories(client, ["tourist", "Petr", "jiangly"]),
             fetch_contest_standings(client, contest_id=1992),
             fetch_problems_by_tag(client, tag="dp"),
         )
@@ -94,4 +102,6 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
+    # Runs on uvloop when installed (pip install codeforcespy[fast]).
+    _ = codeforcespy.install_uvloop()
     asyncio.run(main())
@@ -15,8 +15,20 @@ def main() -> None:
     client = codeforcespy.processors.SyncMethod()
 
     try:
-        # Fetch user information
-        users = client.get_user(handles="tourist")
+        # The four requests are independent, so batch() runs them on a
+        # thread pool. The shared rate limiter still starts them about two
+        # seconds apart under the default Codeforces limit, so they only
+        # overlap if SyncMethod.configure_rate() allows a faster rate.
+        users, rating_history, submissions, contests = client.batch(
+            [
+                ("user.info", {"handles": "tourist"}),
+                ("user.rating", {"handle": "tourist"}),
+                ("user.status", {"handle": "tourist", "count": 5}),
+                ("contest.list", {"gym": False}),
+            ]
+        )
+
+        # User information
         for user in users:
             print(f"Handle: {user.handle}")
             print(f"Rating: {user.rating}")
@@ -24,8 +36,7 @@ def main() -> None:
             print(f"Max Rating: {user.maxRating}")
             print()
 
-        # Get user rating history
-        rating_history = client.get_user_rating(handle="tourist")
+        # User rating history
         print(f"Total contests: {len(rating_history)}")
         if rating_history:
             latest = rating_history[-1]
@@ -33,16 +44,14 @@ def main() -> None:
             print(f"Rating change: {latest.oldRating} -> {latest.newRating}")
             print()
 
-        # Get recent submissions
-        submissions = client.get_user_status(handle="tourist", count=5)
+        # Recent submissions
         print("Recent submissions:")
         for sub in submissions:
             problem_name = sub.problem.name if sub.problem else "Unknown"
             print(f"  - {problem_name}: {sub.verdict}")
         print()
 
-        # List upcoming/recent contests
-        contests = client.get_contest_list(of_gym=False)
+        # Upcoming contests
         upcoming = [c for c in contests if c.phase == "BEFORE"][:3]
         print(f"Upcoming contests ({len(upcoming)}):")
         for contest in upcoming:
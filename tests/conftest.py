@@ -1,11 +1,78 @@
 """Pytest configuration and fixtures."""
 
+import msgspec
 import pytest
 import respx
 
+import codeforcespy.base
+import codeforcespy.limiter
+
 
 @pytest.fixture
 def respx_mock():
     """Fixture for mocking HTTP requests using respx."""
     with respx.mock(base_url="https://codeforces.com/api") as mock:
         yield mock
+
+
+@pytest.fixture(scope="session")
+def mock_user_body() -> bytes:
+    """Mock user.info response body, encoded once per test session."""
+    return msgspec.json.encode(
+        {
+            "status": "OK",
+            "result": [
+                {
+                    "handle": "Fefer_Ivan",
+                    "email": "ivan.fefer@gmail.com",
+                    "vkId": "1656860",
+                    "openId": "http://fefer-ivan.myopenid.com/",
+                    "firstName": "Ivan",
+                    "lastName": "Fefer",
+                    "country": "Russia",
+                    "city": "Saratov",
+                    "organization": "Saratov State University",
+                    "contribution": 0,
+                    "rank": "international master",
+                    "rating": 2345,
+                    "maxRank": "international grandmaster",
+                    "maxRating": 2635,
+                    "lastOnlineTimeSeconds": 1729352932,
+                    "registrationTimeSeconds": 1269784323,
+                    "friendOfCount": 2220,
+                    "avatar": "https://userpic.codeforces.org/no-avatar.jpg",
+                    "titlePhoto": "https://userpic.codeforces.org/no-title.jpg",
+                },
+                {
+                    "handle": "DmitriyH",
+                    "email": "dmitriy.khlopmov@gmail.com",
+                    "vkId": "55734360",
+                    "firstName": "Dmitriy",
+                    "lastName": "Khlopmov",
+                    "country": "Russia",
+                    "city": "Moscow",
+                    "organization": "Unknown",
+                    "contribution": 0,
+                    "rank": "candidate master",
+                    "rating": 2045,
+                    "maxRank": "international master",
+                    "maxRating": 2340,
+                    "lastOnlineTimeSeconds": 1729352932,
+                    "registrationTimeSeconds": 1269784323,
+                    "friendOfCount": 201,
+                    "avatar": "https://userpic.codeforces.org/no-avatar.jpg",
+                    "titlePhoto": "https://userpic.codeforces.org/no-title.jpg",
+                },
+            ],
+        }
+    )
+
+
+@pytest.fixture(autouse=True)
+def unthrottled():
+    """Lift the shared rate limit so mocked requests never wait."""
+    codeforcespy.base.BaseClient.configure_rate(1_000_000, 1.0)
+    yield
+    codeforcespy.base.BaseClient.configure_rate(
+        codeforcespy.limiter.DEFAULT_RATE, codeforcespy.limiter.DEFAULT_PERIOD
+    )
@@ -1,8 +1,13 @@
+import hashlib
 import os
+import pathlib
+import random
 import sys
+import typing
 
 import httpx
 import pytest
+import tomllib
 
 # Ensure we can import the package
 sys.path.insert(0, os.getcwd())
@@ -11,6 +16,11 @@ import codeforcespy
 from codeforcespy import AsyncClient
 from codeforcespy import CodeForcesAPI
 from codeforcespy import SyncClient
+from codeforcespy.abc.endpoints import MethodName
+from codeforcespy.base import BaseClient
+from codeforcespy.base import _sign
+from codeforcespy.features.mixin_base import _METHOD_TABLE
+from codeforcespy.limiter import TokenBucket
 
 
 class TestImports:
@@ -44,6 +54,12 @@ class TestCodeForcesAPI:
             == "https://codeforces.com/api/contest.standings?contestId=566&asManager=False&from=1&count=5&showUnofficial=True"
         )
 
+    def test_method_table_covers_every_method(self):
+        """Verify every API method has a URL builder and response class."""
+        assert set(_METHOD_TABLE) == set(typing.get_args(MethodName))
+        for builder, _ in _METHOD_TABLE.values():
+            assert callable(getattr(self.api, builder))
+
 
 class TestAsyncClient:
     @pytest.mark.asyncio
@@ -58,3 +74,95 @@ class TestSyncClient:
         """Verify SyncClient initializes correctly."""
         with SyncClient() as client:
             assert isinstance(client, httpx.Client)
+
+    def test_sync_client_retries_transient_status(self, respx_mock):
+        """Verify transient error statuses are retried."""
+        route = respx_mock.get("/contest.list").mock(
+            side_effect=[httpx.Response(503), httpx.Response(200, json={})]
+        )
+        with SyncClient(backoff_factor=0.0) as client:
+            response = client.get("https://codeforces.com/api/contest.list")
+
+        assert response.status_code == 200
+        assert route.call_count == 2
+
+    def test_sync_client_retry_honours_limiter_and_retry_after(
+        self, respx_mock, monkeypatch
+    ):
+        """Verify retries wait for Retry-After and take a limiter token."""
+        sleeps = []
+        monkeypatch.setattr("codeforcespy.clients.time.sleep", sleeps.append)
+        bucket = TokenBucket(rate=1, period=60.0)
+        respx_mock.get("/contest.list").mock(
+            side_effect=[
+                httpx.Response(429, headers={"Retry-After": "2"}),
+                httpx.Response(200, json={}),
+            ]
+        )
+        with SyncClient(backoff_factor=0.0, limiter=bucket) as client:
+            response = client.get("https://codeforces.com/api/contest.list")
+
+        assert response.status_code == 200
+        # The retry consumed the only token, so the next caller must wait.
+        assert sleeps == [2.0]
+        assert bucket.reserve() > 0
+
+
+class TestTokenBucket:
+    def test_burst_then_wait(self):
+        """Verify the bucket allows a burst of `rate` and then queues callers."""
+        bucket = TokenBucket(rate=2, period=1.0)
+        assert bucket.reserve() == 0.0
+        assert bucket.reserve() == 0.0
+        assert 0.4 < bucket.reserve() <= 0.5
+        assert 0.9 < bucket.reserve() <= 1.0
+
+    def test_invalid_configuration(self):
+        """Verify non-positive limits are rejected."""
+        with pytest.raises(ValueError):
+            TokenBucket().configure(0, 1.0)
+
+
+class TestPackaging:
+    def test_declared_packages_match_tree(self):
+        """Verify that pyproject.toml lists every package directory."""
+        root = pathlib.Path(__file__).resolve().parents[1]
+        with (root / "pyproject.toml").open("rb") as fh:
+            declared = tomllib.load(fh)["tool"]["setuptools"]["packages"]
+        found = {
+            ".".join(init.parent.relative_to(root).parts)
+            for init in (root / "codeforcespy").rglob("__init__.py")
+        }
+        assert sorted(declared) == sorted(found)
+
+
+class TestSpeedups:
+    def test_install_uvloop_without_uvloop(self, monkeypatch):
+        """Verify the hook is a no-op when uvloop cannot be imported."""
+        monkeypatch.setitem(sys.modules, "uvloop", None)
+        assert codeforcespy.install_uvloop() is False
+
+
+class TestSigning:
+    def test_signature_known_vector(self, monkeypatch):
+        """Verify the apiSig against a hash computed from the documented form."""
+        _sign.cache_clear()
+        monkeypatch.setattr(random, "getrandbits", lambda _: 23456)
+        client = BaseClient(
+            enable_auth=True, auth_key="xxx", secret="yyy", unix_time=1700000000
+        )
+
+        url = client._generate_authorisation(
+            "https://codeforces.com/api/problemset.problems?tags=binary search;*special",
+            "problemset.problems",
+        )
+
+        params = "tags=binary+search;%2Aspecial"
+        digest = hashlib.sha512(
+            f"123456/problemset.problems?apiKey=xxx&{params}&time=1700000000#yyy".encode()
+        ).hexdigest()
+        assert url == (
+            f"https://codeforces.com/api/problemset.problems?{params}"
+            f"&apiKey=xxx&time=1700000000&apiSig=123456{digest}"
+        )
+        _sign.cache_clear()
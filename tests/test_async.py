@@ -1,7 +1,11 @@
 """Tests for asynchronous client."""
 
+import asyncio
+import gc
+
 import pytest
 import respx
+from httpx import Request
 from httpx import Response
 
 from codeforcespy.processors import AsyncMethod
@@ -18,66 +22,15 @@ def client() -> AsyncMethod:
     return AsyncMethod()
 
 
-@pytest.fixture
-def mock_user_response() -> dict[str, object]:
-    """Mock response for user.info."""
-    return {
-        "status": "OK",
-        "result": [
-            {
-                "handle": "Fefer_Ivan",
-                "email": "ivan.fefer@gmail.com",
-                "vkId": "1656860",
-                "openId": "http://fefer-ivan.myopenid.com/",
-                "firstName": "Ivan",
-                "lastName": "Fefer",
-                "country": "Russia",
-                "city": "Saratov",
-                "organization": "Saratov State University",
-                "contribution": 0,
-                "rank": "international master",
-                "rating": 2345,
-                "maxRank": "international grandmaster",
-                "maxRating": 2635,
-                "lastOnlineTimeSeconds": 1729352932,
-                "registrationTimeSeconds": 1269784323,
-                "friendOfCount": 2220,
-                "avatar": "https://userpic.codeforces.org/no-avatar.jpg",
-                "titlePhoto": "https://userpic.codeforces.org/no-title.jpg",
-            },
-            {
-                "handle": "DmitriyH",
-                "email": "dmitriy.khlopmov@gmail.com",
-                "vkId": "55734360",
-                "firstName": "Dmitriy",
-                "lastName": "Khlopmov",
-                "country": "Russia",
-                "city": "Moscow",
-                "organization": "Unknown",
-                "contribution": 0,
-                "rank": "candidate master",
-                "rating": 2045,
-                "maxRank": "international master",
-                "maxRating": 2340,
-                "lastOnlineTimeSeconds": 1729352932,
-                "registrationTimeSeconds": 1269784323,
-                "friendOfCount": 201,
-                "avatar": "https://userpic.codeforces.org/no-avatar.jpg",
-                "titlePhoto": "https://userpic.codeforces.org/no-title.jpg",
-            },
-        ],
-    }
-
-
 @pytest.mark.asyncio
 async def test_get_user_async(
-    respx_mock: respx.MockRouter, handles: str, mock_user_response: dict[str, object]
+    respx_mock: respx.MockRouter, handles: str, mock_user_body: bytes
 ) -> None:
     """Test get_user method asynchronously."""
     _ = respx_mock.get(
         "/user.info",
         params={"handles": handles, "checkHistoricHandles": "True"},
-    ).mock(return_value=Response(200, json=mock_user_response))
+    ).mock(return_value=Response(200, content=mock_user_body))
 
     client = AsyncMethod()
     users = await client.get_user(handles)
@@ -88,6 +41,23 @@ async def test_get_user_async(
     await client.close()
 
 
+@pytest.mark.asyncio
+async def test_get_user_single_async(respx_mock: respx.MockRouter) -> None:
+    """Test that get_user_single unwraps the one-element result."""
+    _ = respx_mock.get("/user.info", params={"handles": "tourist"}).mock(
+        return_value=Response(
+            200, json={"status": "OK", "result": [{"handle": "tourist"}]}
+        )
+    )
+
+    client = AsyncMethod()
+    user = await client.get_user_single("tourist")
+
+    assert user is not None
+    assert user.handle == "tourist"
+    await client.close()
+
+
 @pytest.mark.asyncio
 async def test_get_contest_list_async(respx_mock: respx.MockRouter) -> None:
     """Test get_contest_list method asynchronously."""
@@ -131,3 +101,222 @@ async def test_error_handling_async(respx_mock: respx.MockRouter) -> None:
     with pytest.raises(Exception, match="handle: User not found"):
         _ = await client.get_user(handles="invalid_handle")
     await client.close()
+
+
+@pytest.mark.asyncio
+async def test_etag_revalidation_async(respx_mock: respx.MockRouter) -> None:
+    """Test that a 304 answer is served from the revalidation cache."""
+    mock_response = {"status": "OK", "result": [{"id": 1, "name": "Round 1"}]}
+    route = respx_mock.get("/contest.list", params={"gym": "False"}).mock(
+        side_effect=[
+            Response(200, json=mock_response, headers={"ETag": '"v1"'}),
+            Response(304),
+        ]
+    )
+
+    client = AsyncMethod()
+    first = await client.get_contest_list()
+    second = await client.get_contest_list()
+
+    assert route.call_count == 2
+    assert route.calls[1].request.headers["If-None-Match"] == '"v1"'
+    assert second == first
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_stale_while_revalidate_async(respx_mock: respx.MockRouter) -> None:
+    """Test that an expired entry is served while a refresh runs."""
+    mock_response = {
+        "status": "OK",
+        "result": [{"contestId": 1, "handle": "tourist", "newRating": 3000}],
+    }
+    route = respx_mock.get("/user.rating").mock(
+        return_value=Response(200, json=mock_response)
+    )
+
+    client = AsyncMethod(cache_ttls={"user.rating": 0.01}, stale_while_revalidate=True)
+    first = await client.get_user_rating("tourist")
+    await asyncio.sleep(0.02)
+    stale = await client.get_user_rating("tourist")
+    assert stale == first
+    assert route.call_count == 1
+
+    await asyncio.gather(*client._background_tasks)
+    assert route.call_count == 2
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_get_user_coalescing_async(
+    respx_mock: respx.MockRouter, mock_user_body: bytes
+) -> None:
+    """Test that concurrent get_user calls share one request."""
+    route = respx_mock.get(
+        "/user.info",
+        params={"handles": "Fefer_Ivan;DmitriyH", "checkHistoricHandles": "True"},
+    ).mock(return_value=Response(200, content=mock_user_body))
+
+    client = AsyncMethod()
+    ivan, dmitriy = await asyncio.gather(
+        client.get_user("Fefer_Ivan"), client.get_user("DmitriyH")
+    )
+
+    assert route.call_count == 1
+    assert [user.handle for user in ivan] == ["Fefer_Ivan"]
+    assert [user.handle for user in dmitriy] == ["DmitriyH"]
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_get_user_status_all_async(respx_mock: respx.MockRouter) -> None:
+    """Test that status pages are requested together and flattened in order."""
+
+    def page(request: Request) -> Response:
+        start = int(request.url.params["from"])
+        size = int(request.url.params["count"])
+        ids = [start + i for i in range(size) if start + i <= 5]
+        return Response(200, json={"status": "OK", "result": [{"id": i} for i in ids]})
+
+    route = respx_mock.get("/user.status").mock(side_effect=page)
+
+    client = AsyncMethod()
+    submissions = await client.get_user_status_all("tourist", total=6, page_size=2)
+
+    assert [sub.id for sub in submissions] == [1, 2, 3, 4, 5]
+    assert route.call_count == 3
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_prime_rated_index_replaces_refresh_task_async(
+    respx_mock: respx.MockRouter,
+) -> None:
+    """Test that priming again cancels the earlier periodic reload."""
+    _ = respx_mock.get("/user.ratedList").mock(
+        return_value=Response(
+            200, json={"status": "OK", "result": [{"handle": "Um_nik"}]}
+        )
+    )
+
+    client = AsyncMethod()
+    assert await client.prime_rated_index(refresh_seconds=3600.0) == 1
+    first = client._rated_index_task
+    assert await client.prime_rated_index(refresh_seconds=3600.0) == 1
+    await asyncio.sleep(0)
+
+    assert first is not None
+    assert first.cancelled()
+    assert client._rated_index_task is not first
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_inflight_dedup_async(respx_mock: respx.MockRouter) -> None:
+    """Test that identical concurrent requests share one network fetch."""
+    route = respx_mock.get("/contest.list").mock(
+        return_value=Response(200, json={"status": "OK", "result": []})
+    )
+
+    client = AsyncMethod()
+    results = await asyncio.gather(*(client.get_contest_list() for _ in range(5)))
+
+    assert route.call_count == 1
+    assert results == [[]] * 5
+    assert results[0] is not results[1]
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_inflight_failure_with_cancelled_waiters_async(
+    respx_mock: respx.MockRouter,
+) -> None:
+    """Test that a shared fetch failing after every waiter left is not logged."""
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def fail(request: Request) -> Response:
+        started.set()
+        await release.wait()
+        return Response(200, json={"status": "FAILED", "comment": "boom"})
+
+    _ = respx_mock.get("/contest.list").mock(side_effect=fail)
+    errors: list[dict[str, object]] = []
+    loop = asyncio.get_running_loop()
+    loop.set_exception_handler(lambda _, context: errors.append(context))
+
+    client = AsyncMethod()
+    waiters = [asyncio.create_task(client.get_contest_list()) for _ in range(2)]
+    _ = await started.wait()
+    for waiter in waiters:
+        _ = waiter.cancel()
+    outcomes = await asyncio.gather(*waiters, return_exceptions=True)
+    assert all(isinstance(exc, asyncio.CancelledError) for exc in outcomes)
+    # Their tracebacks reference the shared task; drop them so it can die.
+    del waiter, waiters, outcomes
+    release.set()
+    for _ in range(10):
+        await asyncio.sleep(0)
+    _ = gc.collect()
+
+    loop.set_exception_handler(None)
+    assert not client._inflight
+    assert errors == []
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_async_context_manager_closes_client(
+    respx_mock: respx.MockRouter,
+) -> None:
+    """Test that the async with block closes the client on exit."""
+    _ = respx_mock.get("/contest.list").mock(
+        return_value=Response(200, json={"status": "OK", "result": []})
+    )
+
+    async with AsyncMethod() as client:
+        assert await client.get_contest_list() == []
+
+    assert client._client.is_closed
+
+
+@pytest.mark.asyncio
+async def test_batch_async(respx_mock: respx.MockRouter) -> None:
+    """Test that batch gathers several calls and keeps their order."""
+    _ = respx_mock.get("/user.rating").mock(
+        return_value=Response(200, json={"status": "OK", "result": []})
+    )
+    _ = respx_mock.get("/contest.list").mock(
+        return_value=Response(
+            200, json={"status": "OK", "result": [{"id": 1, "name": "Round 1"}]}
+        )
+    )
+
+    async with AsyncMethod() as client:
+        ratings, contests = await client.batch(
+            [("user.rating", {"handle": "tourist"}), ("contest.list", {"gym": False})]
+        )
+
+    assert ratings == []
+    assert [contest.id for contest in contests] == [1]
+
+
+@pytest.mark.asyncio
+async def test_get_users_ratings_bulk_async(respx_mock: respx.MockRouter) -> None:
+    """Test that rating histories are fetched per handle and keyed by handle."""
+
+    def ratings(request: Request) -> Response:
+        handle = request.url.params["handle"]
+        return Response(
+            200,
+            json={"status": "OK", "result": [{"handle": handle, "newRating": 1500}]},
+        )
+
+    route = respx_mock.get("/user.rating").mock(side_effect=ratings)
+
+    async with AsyncMethod() as client:
+        histories = await client.get_users_ratings_bulk(["tourist", "Petr"])
+
+    assert list(histories) == ["tourist", "Petr"]
+    assert [change.handle for change in histories["Petr"]] == ["Petr"]
+    assert route.call_count == 2
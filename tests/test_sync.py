@@ -1,9 +1,21 @@
 """Tests for synchronous client."""
 
+import collections.abc
+import gc
+import threading
+import time
+import weakref
+
 import pytest
 import respx
+from httpx import Request
 from httpx import Response
 
+from codeforcespy.abc.objects import User
+from codeforcespy.batching import SyncUserInfoBatcher
+from codeforcespy.cache import CacheEntry
+from codeforcespy.cache import ResponseCache
+from codeforcespy.errors import APIError
 from codeforcespy.processors import SyncMethod
 
 
@@ -23,65 +35,14 @@ def client() -> SyncMethod:
     return SyncMethod()
 
 
-@pytest.fixture
-def mock_user_response() -> dict[str, object]:
-    """Mock response for user.info."""
-    return {
-        "status": "OK",
-        "result": [
-            {
-                "handle": "Fefer_Ivan",
-                "email": "ivan.fefer@gmail.com",
-                "vkId": "1656860",
-                "openId": "http://fefer-ivan.myopenid.com/",
-                "firstName": "Ivan",
-                "lastName": "Fefer",
-                "country": "Russia",
-                "city": "Saratov",
-                "organization": "Saratov State University",
-                "contribution": 0,
-                "rank": "international master",
-                "rating": 2345,
-                "maxRank": "international grandmaster",
-                "maxRating": 2635,
-                "lastOnlineTimeSeconds": 1729352932,
-                "registrationTimeSeconds": 1269784323,
-                "friendOfCount": 2220,
-                "avatar": "https://userpic.codeforces.org/no-avatar.jpg",
-                "titlePhoto": "https://userpic.codeforces.org/no-title.jpg",
-            },
-            {
-                "handle": "DmitriyH",
-                "email": "dmitriy.khlopmov@gmail.com",
-                "vkId": "55734360",
-                "firstName": "Dmitriy",
-                "lastName": "Khlopmov",
-                "country": "Russia",
-                "city": "Moscow",
-                "organization": "Unknown",
-                "contribution": 0,
-                "rank": "candidate master",
-                "rating": 2045,
-                "maxRank": "international master",
-                "maxRating": 2340,
-                "lastOnlineTimeSeconds": 1729352932,
-                "registrationTimeSeconds": 1269784323,
-                "friendOfCount": 201,
-                "avatar": "https://userpic.codeforces.org/no-avatar.jpg",
-                "titlePhoto": "https://userpic.codeforces.org/no-title.jpg",
-            },
-        ],
-    }
-
-
 def test_get_user(
-    respx_mock: respx.MockRouter, handles: str, mock_user_response: dict[str, object]
+    respx_mock: respx.MockRouter, handles: str, mock_user_body: bytes
 ) -> None:
     """Test get_user method."""
     _ = respx_mock.get(
         "/user.info",
         params={"handles": handles, "checkHistoricHandles": "True"},
-    ).mock(return_value=Response(200, json=mock_user_response))
+    ).mock(return_value=Response(200, content=mock_user_body))
 
     client = SyncMethod()
     users = client.get_user(handles)
@@ -133,3 +94,415 @@ def test_error_handling(respx_mock: respx.MockRouter) -> None:
     with pytest.raises(Exception, match="handle: User not found"):
         _ = client.get_user(handles="invalid_handle")
     client.close()
+
+
+def test_etag_revalidation(respx_mock: respx.MockRouter) -> None:
+    """Test that a 304 answer is served from the revalidation cache."""
+    mock_response = {"status": "OK", "result": [{"id": 1, "name": "Round 1"}]}
+    route = respx_mock.get("/contest.list", params={"gym": "False"}).mock(
+        side_effect=[
+            Response(200, json=mock_response, headers={"ETag": '"v1"'}),
+            Response(304),
+        ]
+    )
+
+    client = SyncMethod()
+    first = client.get_contest_list()
+    second = client.get_contest_list()
+
+    assert route.call_count == 2
+    assert route.calls[1].request.headers["If-None-Match"] == '"v1"'
+    assert second == first
+    client.close()
+
+
+def test_etag_revalidation_after_eviction(respx_mock: respx.MockRouter) -> None:
+    """Test that a 304 for an evicted entry is re-requested in full."""
+    mock_response = {"status": "OK", "result": [{"id": 1, "name": "Round 1"}]}
+    client = SyncMethod(cache_max_entries=1)
+
+    def answer(request: Request) -> Response:
+        if "If-None-Match" not in request.headers:
+            return Response(200, json=mock_response, headers={"ETag": '"v1"'})
+        # Another response pushes this one out before the 304 is handled.
+        client._response_cache.store(
+            "other", CacheEntry(stored_at=0.0, etag=None, result=[])
+        )
+        return Response(304)
+
+    route = respx_mock.get("/contest.list", params={"gym": "False"}).mock(
+        side_effect=answer
+    )
+
+    first = client.get_contest_list()
+    second = client.get_contest_list()
+
+    assert route.call_count == 3
+    assert "If-None-Match" not in route.calls[2].request.headers
+    assert second == first
+    client.close()
+
+
+def test_last_modified_revalidation(respx_mock: respx.MockRouter) -> None:
+    """Test that Last-Modified is echoed back as If-Modified-Since."""
+    stamp = "Wed, 14 Oct 2026 10:00:00 GMT"
+    route = respx_mock.get("/user.blogEntries").mock(
+        side_effect=[
+            Response(
+                200,
+                json={"status": "OK", "result": [{"id": 7}]},
+                headers={"Last-Modified": stamp},
+            ),
+            Response(304),
+        ]
+    )
+
+    client = SyncMethod(cache_ttls={"user.blogEntries": 0})
+    first = client.get_user_blog_entries("tourist")
+    second = client.get_user_blog_entries("tourist")
+
+    assert route.call_count == 2
+    assert route.calls[1].request.headers["If-Modified-Since"] == stamp
+    assert "If-None-Match" not in route.calls[1].request.headers
+    assert second == first
+    client.close()
+
+
+def test_response_cache_evicts_least_recently_used() -> None:
+    """Test that the response cache stays within its entry limit."""
+    cache = ResponseCache(max_entries=2)
+    for url in ("a", "b"):
+        cache.store(url, CacheEntry(stored_at=0.0, etag=url, result=[]))
+    assert cache.get("a") is not None
+    cache.store("c", CacheEntry(stored_at=0.0, etag="c", result=[]))
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+
+
+def test_ttl_cache_and_invalidate(
+    respx_mock: respx.MockRouter, handles: str, mock_user_body: bytes
+) -> None:
+    """Test that cached user lookups are reused until invalidated."""
+    route = respx_mock.get("/user.info").mock(
+        return_value=Response(200, content=mock_user_body)
+    )
+
+    client = SyncMethod()
+    first = client.get_user(handles)
+    second = client.get_user(handles)
+    assert route.call_count == 1
+    assert second == first
+
+    assert client.invalidate("Fefer_Ivan") == 1
+    _ = client.get_user(handles)
+    assert route.call_count == 2
+    client.close()
+
+
+def test_expired_ttl_entry_is_dropped(respx_mock: respx.MockRouter) -> None:
+    """Test that an expired entry without validators is removed on lookup."""
+    route = respx_mock.get("/user.rating").mock(
+        return_value=Response(200, json={"status": "OK", "result": []})
+    )
+
+    client = SyncMethod()
+    _ = client.get_user_rating("tourist")
+    url = client._url_generator.user_rating("tourist")
+    entry = client._response_cache.get(url)
+    assert entry is not None
+    entry.stored_at -= 3600.0
+
+    assert client._cached_result("user.rating", url) == (None, False)
+    assert client._response_cache.get(url) is None
+    _ = client.get_user_rating("tourist")
+
+    assert route.call_count == 2
+    client.close()
+
+
+class _FakeLookup:
+    """Stand-in for a client's ``user.info`` lookup, blocking until released."""
+
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+        self.release = threading.Event()
+
+    def lookup(self, handles: str, check_historic_handles: bool | None) -> list[User]:
+        self.calls.append(handles)
+        _ = self.release.wait(5.0)
+        if "missing" in handles.split(";"):
+            raise APIError("handles: User with handle missing not found")
+        return [User(handle=handle) for handle in handles.split(";")]
+
+
+def _overlapping_lookups(
+    batcher: SyncUserInfoBatcher, fake: _FakeLookup, queued: tuple[str, ...]
+) -> dict[str, object]:
+    """
+    Submit ``tourist`` inline and ``Petr`` to the worker, queue `queued`
+    behind them, then release every lookup and collect the outcomes.
+    """
+    outcomes: dict[str, object] = {}
+
+    def submit(handles: str) -> None:
+        try:
+            users = batcher.submit(handles, True)
+        except APIError as exc:
+            outcomes[handles] = exc
+        else:
+            outcomes[handles] = [user.handle for user in users]
+
+    def wait_until(ready: collections.abc.Callable[[], bool]) -> None:
+        deadline = time.monotonic() + 5.0
+        while not ready():
+            assert time.monotonic() < deadline
+            time.sleep(0.001)
+
+    threads = [
+        threading.Thread(target=submit, args=(handles,))
+        for handles in ("tourist", "Petr", *queued)
+    ]
+    threads[0].start()
+    wait_until(lambda: len(fake.calls) == 1)
+    threads[1].start()
+    wait_until(lambda: len(fake.calls) == 2)
+    for thread in threads[2:]:
+        thread.start()
+    wait_until(lambda: batcher._queue.qsize() == len(queued))
+    fake.release.set()
+    for thread in threads:
+        thread.join(5.0)
+    return outcomes
+
+
+def test_sync_batcher_coalesces_across_threads() -> None:
+    """Test that lookups queued from several threads share one request."""
+    fake = _FakeLookup()
+    batcher = SyncUserInfoBatcher(fake.lookup, idle_timeout=0.05)
+
+    outcomes = _overlapping_lookups(batcher, fake, ("Um_nik", "Petr;tourist"))
+    worker = batcher._worker
+
+    assert fake.calls[:2] == ["tourist", "Petr"]
+    assert len(fake.calls) == 3
+    assert sorted(fake.calls[2].split(";")) == ["Petr", "Um_nik", "tourist"]
+    assert outcomes == {
+        "tourist": ["tourist"],
+        "Petr": ["Petr"],
+        "Um_nik": ["Um_nik"],
+        "Petr;tourist": ["Petr", "tourist"],
+    }
+    assert worker is not None
+    worker.join(5.0)
+    assert not worker.is_alive()
+    assert batcher._worker is None
+
+
+def test_sync_batcher_isolates_errors() -> None:
+    """Test that a failing handle only fails the caller that asked for it."""
+    fake = _FakeLookup()
+    batcher = SyncUserInfoBatcher(fake.lookup)
+
+    outcomes = _overlapping_lookups(batcher, fake, ("missing", "Um_nik"))
+    batcher.close()
+
+    assert outcomes["tourist"] == ["tourist"]
+    assert outcomes["Petr"] == ["Petr"]
+    assert outcomes["Um_nik"] == ["Um_nik"]
+    assert isinstance(outcomes["missing"], APIError)
+    # The combined request fails, then each queued caller is retried alone.
+    assert len(fake.calls) == 5
+
+
+def test_sync_batcher_rejects_use_after_close() -> None:
+    """Test that submitting to a closed batcher raises instead of hanging."""
+    fake = _FakeLookup()
+    fake.release.set()
+    batcher = SyncUserInfoBatcher(fake.lookup)
+    assert [user.handle for user in batcher.submit("tourist", True)] == ["tourist"]
+    batcher.close()
+
+    with pytest.raises(RuntimeError):
+        _ = batcher.submit("tourist", True)
+
+
+def test_unclosed_clients_are_collected(respx_mock: respx.MockRouter) -> None:
+    """Test that a lone get_user runs inline and leaves nothing behind."""
+    _ = respx_mock.get("/user.info").mock(
+        return_value=Response(200, json={"status": "OK", "result": [{"handle": "a"}]})
+    )
+
+    refs = []
+    for _ in range(5):
+        client = SyncMethod()
+        _ = client.get_user("a")
+        assert client._user_info_batcher._worker is None
+        refs.append(weakref.ref(client))
+    del client
+    _ = gc.collect()
+
+    assert all(ref() is None for ref in refs)
+
+
+def test_get_user_status_stream(respx_mock: respx.MockRouter) -> None:
+    """Test that submissions are streamed page by page."""
+    pages = [
+        {"status": "OK", "result": [{"id": 3}, {"id": 2}]},
+        {"status": "OK", "result": [{"id": 1}]},
+    ]
+    route = respx_mock.get("/user.status").mock(
+        side_effect=[Response(200, json=page) for page in pages]
+    )
+
+    client = SyncMethod()
+    ids = [sub.id for sub in client.get_user_status_stream("tourist", page_size=2)]
+
+    assert ids == [3, 2, 1]
+    assert route.calls[1].request.url.params["from"] == "3"
+    client.close()
+
+
+def test_prime_rated_index(respx_mock: respx.MockRouter) -> None:
+    """Test that indexed handles are served without a user.info request."""
+    _ = respx_mock.get("/user.ratedList").mock(
+        return_value=Response(
+            200,
+            json={
+                "status": "OK",
+                "result": [{"handle": "tourist"}, {"handle": "Petr"}],
+            },
+        )
+    )
+    info = respx_mock.get("/user.info").mock(
+        return_value=Response(
+            200, json={"status": "OK", "result": [{"handle": "Um_nik"}]}
+        )
+    )
+
+    client = SyncMethod()
+    assert client.prime_rated_index() == 2
+
+    users = client.get_user("Petr;tourist")
+    assert [user.handle for user in users] == ["Petr", "tourist"]
+    assert info.call_count == 0
+
+    _ = client.get_user("Um_nik")
+    assert info.call_count == 1
+    client.close()
+
+
+def test_negative_cache_for_unknown_handle(respx_mock: respx.MockRouter) -> None:
+    """Test that a "not found" failure is replayed without a new request."""
+    comment = "handle: User with handle nosuchperson not found"
+    route = respx_mock.get("/user.rating").mock(
+        return_value=Response(400, json={"status": "FAILED", "comment": comment})
+    )
+
+    client = SyncMethod()
+    for _ in range(3):
+        with pytest.raises(APIError, match="not found"):
+            _ = client.get_user_rating("nosuchperson")
+    assert route.call_count == 1
+
+    assert client.invalidate("nosuchperson") == 1
+    with pytest.raises(APIError):
+        _ = client.get_user_rating("nosuchperson")
+    assert route.call_count == 2
+    client.close()
+
+
+def test_context_manager_closes_client(respx_mock: respx.MockRouter) -> None:
+    """Test that the with block reuses one client and closes it on exit."""
+    route = respx_mock.get("/contest.list").mock(
+        return_value=Response(200, json={"status": "OK", "result": []})
+    )
+
+    with SyncMethod() as client:
+        _ = client.get_contest_list(of_gym=False)
+        _ = client.get_contest_list(of_gym=True)
+        assert not client._client.is_closed
+
+    assert route.call_count == 2
+    assert client._client.is_closed
+
+
+def test_batch(respx_mock: respx.MockRouter) -> None:
+    """Test that batch runs several calls and keeps their order."""
+    _ = respx_mock.get("/user.rating").mock(
+        return_value=Response(200, json={"status": "OK", "result": []})
+    )
+    _ = respx_mock.get("/contest.list").mock(
+        return_value=Response(
+            200, json={"status": "OK", "result": [{"id": 1, "name": "Round 1"}]}
+        )
+    )
+
+    with SyncMethod() as client:
+        ratings, contests = client.batch(
+            [("user.rating", {"handle": "tourist"}), ("contest.list", {"gym": False})]
+        )
+
+    assert ratings == []
+    assert [contest.id for contest in contests] == [1]
+
+
+def test_get_users_bulk(respx_mock: respx.MockRouter) -> None:
+    """Test that bulk lookups are packed into chunked requests in order."""
+
+    def users(request: Request) -> Response:
+        handles = request.url.params["handles"].split(";")
+        return Response(
+            200,
+            json={"status": "OK", "result": [{"handle": h} for h in handles]},
+        )
+
+    route = respx_mock.get("/user.info").mock(side_effect=users)
+
+    with SyncMethod() as client:
+        found = client.get_users_bulk(["a", "b", "c"], chunk_size=2)
+
+    assert [user.handle for user in found] == ["a", "b", "c"]
+    assert route.call_count == 2
+
+
+def test_get_raw(respx_mock: respx.MockRouter) -> None:
+    """Test that get_raw returns the body untouched and still raises failures."""
+    body = b'{"status":"OK","result":[{"id":1,"name":"Round 1"}]}'
+    _ = respx_mock.get("/contest.list").mock(return_value=Response(200, content=body))
+    _ = respx_mock.get("/user.rating").mock(
+        return_value=Response(
+            400, json={"status": "FAILED", "comment": "handle: User not found"}
+        )
+    )
+
+    with SyncMethod() as client:
+        assert client.get_raw("contest.list", gym=False) == body
+        with pytest.raises(APIError):
+            _ = client.get_raw("user.rating", handle="nobody")
+
+
+def test_get_contest_standings_shapes(respx_mock: respx.MockRouter) -> None:
+    """Test that standings decode to one contest and lists of problems and rows."""
+    _ = respx_mock.get("/contest.standings").mock(
+        return_value=Response(
+            200,
+            json={
+                "status": "OK",
+                "result": {
+                    "contest": {"id": 1992, "name": "Round 1"},
+                    "problems": [{"contestId": 1992, "index": "A"}],
+                    "rows": [{"rank": 1, "points": 3.0}],
+                },
+            },
+        )
+    )
+
+    with SyncMethod() as client:
+        (standing,) = client.get_contest_standings(contest_id=1992)
+
+    assert standing.contest is not None
+    assert standing.contest.name == "Round 1"
+    assert [problem.index for problem in standing.problems or []] == ["A"]
+    assert [row.rank for row in standing.rows or []] == [1]